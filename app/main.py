@@ -1,9 +1,45 @@
 """Unified PSA Processing App - Product + Planogram tables."""
-import io
+import asyncio
+import atexit
+import functools
+import itertools
+import logging
+import logging.handlers
+import mmap
+import os
+import queue
+import string
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 
-from fastapi import FastAPI, File, UploadFile
-from fastapi.responses import StreamingResponse, HTMLResponse, JSONResponse
+import orjson
+from fastapi import FastAPI, File, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse, HTMLResponse, ORJSONResponse, Response
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+
+def _configure_logging():
+    """Route all log records through a queue so request handlers never block on stdout.
+    
+    Handlers only enqueue records; a QueueListener thread does the actual
+    formatting and writing to stderr.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))  # full format applied by the listener
+    logging.basicConfig(level=LOG_LEVEL, handlers=[queue_handler])
+    listener.start()
+    atexit.register(listener.stop)
+
+
+_configure_logging()
+logger = logging.getLogger(__name__)
 
 # Track import errors
 import_errors = []
@@ -15,10 +51,10 @@ except Exception as e:
     process_psa_file = None
 
 try:
-    from app.services.excel_exporter import create_excel_export
+    from app.services.excel_exporter import iter_excel_export
 except Exception as e:
     import_errors.append(f"excel_exporter: {str(e)}")
-    create_excel_export = None
+    iter_excel_export = None
 
 try:
     from app.web.templates import get_home_page
@@ -27,18 +63,109 @@ except Exception as e:
     get_home_page = None
 
 try:
-    from app.web.validation_dashboard import get_validation_dashboard
+    from app.web.validation_dashboard import iter_validation_dashboard
 except Exception as e:
     import_errors.append(f"validation_dashboard: {str(e)}")
-    get_validation_dashboard = None
+    iter_validation_dashboard = None
+
+app = FastAPI(title="PSA Unified Processor", default_response_class=ORJSONResponse)
+
+# Static /test payload, serialized once at import
+_TEST_BODY = orjson.dumps({"status": "working", "message": "Server is running!"})
+
+# Worker processes for PSA extraction/validation. 0 (default) runs it in the
+# threadpool instead; set >0 to let several uploads use multiple cores.
+PROCESS_WORKERS = int(os.getenv("PSA_PROCESS_WORKERS", "0"))
+_process_pool = None
+
+# PSA uploads at least this large are memory-mapped instead of read into RAM
+MMAP_UPLOAD_THRESHOLD = 32 * 1024 * 1024
+
+
+def _get_process_pool():
+    """Create the process pool on first use (never at import, for spawn-based platforms)."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=PROCESS_WORKERS)
+    return _process_pool
+
+
+async def _read_psa_upload(upload: UploadFile):
+    """Return the uploaded PSA content as bytes, or as a read-only mmap for large uploads.
+    
+    Starlette has already spooled a large upload to a temp file on disk, so
+    mapping that file avoids copying the whole PSA into the process heap.
+    The process pool needs picklable bytes, so it always gets a plain read.
+    """
+    if PROCESS_WORKERS == 0 and upload.size is not None and upload.size >= MMAP_UPLOAD_THRESHOLD:
+        upload.file.flush()
+        return mmap.mmap(upload.file.fileno(), 0, access=mmap.ACCESS_READ)
+    return await upload.read()
+
+
+async def _process_psa_off_loop(psa_bytes: bytes, excel_bytes):
+    """Run process_psa_file without blocking the event loop."""
+    if PROCESS_WORKERS > 0:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_process_pool(),
+            functools.partial(process_psa_file, psa_bytes, excel_reference_bytes=excel_bytes)
+        )
+    return await run_in_threadpool(process_psa_file, psa_bytes, excel_reference_bytes=excel_bytes)
+
+
+# Error page for HTML endpoints (built once, filled in per failure)
+_ERROR_HTML_TEMPLATE = string.Template("""
+        <!DOCTYPE html>
+        <html><head><title>Error</title></head>
+        <body style="font-family: monospace; padding: 20px; background: #1a1a1a; color: #ff6b6b;">
+        <h1>❌ Error Processing PSA File</h1>
+        <h2>Error Type: $error_type</h2>
+        <pre>$error</pre>
+        <h3>Traceback:</h3>
+        <pre>$traceback</pre>
+        </body></html>
+        """)
 
-app = FastAPI(title="PSA Unified Processor")
+# Endpoints that report failures as an HTML page instead of JSON
+HTML_ERROR_PATHS = {"/view-report"}
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Turn any unhandled endpoint error into a detailed HTML page or JSON body.
+    
+    The server still logs the exception with its traceback once this
+    response has been sent.
+    """
+    error_traceback = "".join(traceback.format_exception(exc))
+    if request.url.path in HTML_ERROR_PATHS:
+        return HTMLResponse(_ERROR_HTML_TEMPLATE.substitute(
+            error_type=type(exc).__name__,
+            error=str(exc),
+            traceback=error_traceback,
+        ))
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "error": str(exc),
+            "error_type": type(exc).__name__,
+            "traceback": error_traceback
+        }
+    )
+
+
+async def _prepend_chunk(first_chunk, chunks):
+    """Async generator yielding first_chunk followed by the rest of chunks."""
+    yield first_chunk
+    async for chunk in chunks:
+        yield chunk
 
 
 @app.get("/", response_class=HTMLResponse)
 async def home():
     """Serve the upload page."""
-    print("[DEBUG] Home page accessed")
+    logger.debug("Home page accessed")
     if get_home_page is None:
         return f"<h1>Error: templates module failed to import</h1><pre>{import_errors}</pre>"
     return get_home_page()
@@ -46,8 +173,8 @@ async def home():
 @app.get("/test")
 async def test():
     """Test endpoint to verify server is working."""
-    print("[DEBUG] Test endpoint accessed")
-    return {"status": "working", "message": "Server is running!"}
+    logger.debug("Test endpoint accessed")
+    return Response(_TEST_BODY, media_type="application/json")
 
 @app.get("/routes")
 async def list_routes():
@@ -60,28 +187,28 @@ async def list_routes():
                 "methods": list(route.methods) if hasattr(route, 'methods') else [],
                 "name": route.name if hasattr(route, 'name') else None
             })
-    return {"routes": routes, "total": len(routes)}
+    return ORJSONResponse({"routes": routes, "total": len(routes)})
 
 @app.get("/debug")
 async def debug_info():
     """Show debug information about imports and configuration."""
-    return {
+    return ORJSONResponse({
         "import_errors": import_errors,
         "modules_loaded": {
             "psa_processor": process_psa_file is not None,
-            "excel_exporter": create_excel_export is not None,
+            "excel_exporter": iter_excel_export is not None,
             "templates": get_home_page is not None,
-            "validation_dashboard": get_validation_dashboard is not None
+            "validation_dashboard": iter_validation_dashboard is not None
         },
         "status": "ok" if len(import_errors) == 0 else "errors"
-    }
+    })
 
 
 @app.post("/view-report", response_class=HTMLResponse)
 async def view_report(
     psa_file: UploadFile = File(...),
     excel_file: UploadFile = File(None),
-) -> str:
+) -> StreamingResponse:
     """Upload PSA and view validation report in browser.
     
     Args:
@@ -90,60 +217,44 @@ async def view_report(
     """
     
     # Check for import errors
-    if process_psa_file is None or get_validation_dashboard is None:
+    if process_psa_file is None or iter_validation_dashboard is None:
         return f"""<html><body>
         <h1>Import Error</h1>
         <p>Required modules failed to load:</p>
         <pre>{import_errors}</pre>
         </body></html>"""
     
+    logger.info("POST /view-report endpoint called")
+    logger.debug("Received PSA file: %s", psa_file.filename)
+    psa_bytes = await _read_psa_upload(psa_file)
+    logger.debug("Read %s bytes from uploaded PSA file", len(psa_bytes))
+    
+    # Read Excel reference file if provided
+    excel_bytes = None
+    if excel_file and excel_file.filename:
+        logger.debug("Received Excel file: %s", excel_file.filename)
+        excel_bytes = await excel_file.read()
+        logger.debug("Read %s bytes from Excel file", len(excel_bytes))
+    else:
+        logger.debug("No Excel reference file provided - department validation will be skipped")
+    
+    # Process PSA file (extract Product + Planogram)
+    logger.debug("Processing PSA file for web report...")
     try:
-        print("="*80)
-        print("[API] POST /view-report endpoint called!")
-        print("="*80)
-        print(f"[API] Received PSA file: {psa_file.filename}")
-        psa_bytes = await psa_file.read()
-        print(f"[API] Read {len(psa_bytes)} bytes from uploaded PSA file")
-        
-        # Read Excel reference file if provided
-        excel_bytes = None
-        if excel_file and excel_file.filename:
-            print(f"[API] Received Excel file: {excel_file.filename}")
-            excel_bytes = await excel_file.read()
-            print(f"[API] Read {len(excel_bytes)} bytes from Excel file")
-        else:
-            print("[API] No Excel reference file provided - department validation will be skipped")
-        
-        # Process PSA file (extract Product + Planogram)
-        print(f"[API] Processing PSA file for web report...")
-        data = process_psa_file(psa_bytes, excel_reference_bytes=excel_bytes)
-        
-        # Generate HTML dashboard
-        print(f"[API] Generating validation dashboard HTML...")
-        html = get_validation_dashboard(data)
-        
-        print(f"[API] Returning HTML dashboard ({len(html)} bytes)")
-        return html
-        
-    except Exception as e:
-        print("="*80)
-        print(f"[ERROR] Failed to generate report: {e}")
-        print("="*80)
-        import traceback
-        traceback.print_exc()
-        # Return detailed error HTML instead of raising
-        error_html = f"""
-        <!DOCTYPE html>
-        <html><head><title>Error</title></head>
-        <body style="font-family: monospace; padding: 20px; background: #1a1a1a; color: #ff6b6b;">
-        <h1>❌ Error Processing PSA File</h1>
-        <h2>Error Type: {type(e).__name__}</h2>
-        <pre>{str(e)}</pre>
-        <h3>Traceback:</h3>
-        <pre>{traceback.format_exc()}</pre>
-        </body></html>
-        """
-        return error_html
+        data = await _process_psa_off_loop(psa_bytes, excel_bytes)
+    finally:
+        if isinstance(psa_bytes, mmap.mmap):
+            psa_bytes.close()
+    
+    # Generate HTML dashboard
+    logger.debug("Generating validation dashboard HTML...")
+    # Streamed section by section. The head is pulled here so errors in
+    # the summary still reach the error handler.
+    html_chunks = iter_validation_dashboard(data)
+    first_chunk = await html_chunks.__anext__()
+    
+    logger.debug("Streaming HTML dashboard to client")
+    return StreamingResponse(_prepend_chunk(first_chunk, html_chunks), media_type="text/html")
 
 
 @app.post("/process")
@@ -159,8 +270,8 @@ async def process(
     """
     
     # Check for import errors
-    if process_psa_file is None or create_excel_export is None:
-        return JSONResponse(
+    if process_psa_file is None or iter_excel_export is None:
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Import error",
@@ -168,53 +279,40 @@ async def process(
             }
         )
     
+    logger.info("POST /process endpoint called")
+    logger.debug("Received PSA file: %s", psa_file.filename)
+    psa_bytes = await _read_psa_upload(psa_file)
+    logger.debug("Read %s bytes from uploaded PSA file", len(psa_bytes))
+    
+    # Read Excel reference file if provided
+    excel_bytes = None
+    if excel_file and excel_file.filename:
+        logger.debug("Received Excel file: %s", excel_file.filename)
+        excel_bytes = await excel_file.read()
+        logger.debug("Read %s bytes from Excel file", len(excel_bytes))
+    else:
+        logger.debug("No Excel reference file provided - department validation will be skipped")
+    
+    # Process PSA file (extract Product + Planogram)
+    logger.debug("Processing PSA file...")
     try:
-        print("="*80)
-        print("[API] POST /process endpoint called!")
-        print("="*80)
-        print(f"[API] Received PSA file: {psa_file.filename}")
-        psa_bytes = await psa_file.read()
-        print(f"[API] Read {len(psa_bytes)} bytes from uploaded PSA file")
-        
-        # Read Excel reference file if provided
-        excel_bytes = None
-        if excel_file and excel_file.filename:
-            print(f"[API] Received Excel file: {excel_file.filename}")
-            excel_bytes = await excel_file.read()
-            print(f"[API] Read {len(excel_bytes)} bytes from Excel file")
-        else:
-            print("[API] No Excel reference file provided - department validation will be skipped")
-        
-        # Process PSA file (extract Product + Planogram)
-        print(f"[API] Processing PSA file...")
-        data = process_psa_file(psa_bytes, excel_reference_bytes=excel_bytes)
-        
-        # Generate ZIP with Excel files
-        print(f"[API] Generating Excel exports...")
-        zip_bytes = create_excel_export(data)
-        
-        print(f"[API] Returning ZIP ({len(zip_bytes)} bytes)")
-        
-        # Return ZIP file
-        headers = {"Content-Disposition": "attachment; filename=PSA_Export.zip"}
-        return StreamingResponse(
-            io.BytesIO(zip_bytes),
-            media_type="application/zip",
-            headers=headers
-        )
-    except Exception as e:
-        print("="*80)
-        print(f"[ERROR] Failed to process PSA file: {e}")
-        print("="*80)
-        import traceback
-        traceback.print_exc()
-        # Return detailed error as JSON
-        from fastapi.responses import JSONResponse
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "traceback": traceback.format_exc()
-            }
-        )
+        data = await _process_psa_off_loop(psa_bytes, excel_bytes)
+    finally:
+        if isinstance(psa_bytes, mmap.mmap):
+            psa_bytes.close()
+    
+    # Generate ZIP with Excel files - streamed to the client as it is built.
+    # The first chunk is pulled here so PSA_Data.xlsx errors still reach the error handler.
+    logger.debug("Generating Excel exports...")
+    zip_chunks = iter_excel_export(data)
+    first_chunk = await run_in_threadpool(next, zip_chunks)
+    
+    logger.debug("Streaming ZIP to client")
+    
+    # Return ZIP file
+    headers = {"Content-Disposition": "attachment; filename=PSA_Export.zip"}
+    return StreamingResponse(
+        itertools.chain([first_chunk], zip_chunks),
+        media_type="application/zip",
+        headers=headers
+    )
@@ -2,14 +2,42 @@
 from __future__ import annotations
 
 import io
+import logging
 import zipfile
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Dict, Any, Iterator
 
 import pandas as pd
-from openpyxl.styles import Font, PatternFill, Alignment
+import xlsxwriter
 
 from app.services.validation_reporter import generate_validation_report
 
+logger = logging.getLogger(__name__)
+
+# Planogram header columns highlighted in yellow (smart-mapped columns H, I, J, K)
+PLANOGRAM_HIGHLIGHT_COLUMNS = (8, 9, 10, 11)
+
+# Size of the pieces each xlsx file is fed to the ZIP stream in
+ZIP_CHUNK_SIZE = 64 * 1024
+
+# PSA_Data.xlsx writer options. constant_memory flushes each row as soon as
+# the next one starts instead of holding the workbook in memory; PSA values
+# are plain text, so cells are never turned into URLs, formulas or numbers
+PSA_DATA_WORKBOOK_OPTIONS = {
+    'constant_memory': True,
+    'strings_to_urls': False,
+    'strings_to_formulas': False,
+    'strings_to_numbers': False,
+}
+
+# xlsx files are already deflated zip archives - compressing them again
+# saves next to nothing and costs CPU on every export
+ZIP_COMPRESSION = zipfile.ZIP_STORED
+
+# Builds Validation_Report.xlsx while PSA_Data.xlsx is being written
+_report_executor = ThreadPoolExecutor(thread_name_prefix="validation-report")
+
 
 def create_excel_export(data: Dict[str, Any]) -> bytes:
     """Create ZIP file with multi-tab PSA_Data.xlsx and combined validation report.
@@ -25,47 +53,100 @@ def create_excel_export(data: Dict[str, Any]) -> bytes:
         - PSA_Data.xlsx (multi-tab: Product + Planogram + Fixture sheets)
         - Validation_Report.xlsx (combined checks from both tables)
     """
+    zip_bytes = b''.join(iter_excel_export(data))
+    logger.debug("Generated ZIP (%s bytes) with 2 files: PSA_Data.xlsx + Validation_Report.xlsx", len(zip_bytes))
+    return zip_bytes
+
+
+def iter_excel_export(data: Dict[str, Any]) -> Iterator[bytes]:
+    """Yield the export ZIP in chunks while it is being built.
+    
+    PSA_Data.xlsx is written to the ZIP first, so its bytes can be sent to the
+    client while Validation_Report.xlsx is still being generated on a worker
+    thread (the two workbooks are independent).
+    
+    Args:
+        data: Dict from psa_processor (see create_excel_export)
+        
+    Yields:
+        Consecutive pieces of the ZIP file
+    """
+    report_future = _report_executor.submit(_build_validation_report_xlsx, data)
+    
+    stream = _ChunkStream()
+    with zipfile.ZipFile(stream, mode='w', compression=ZIP_COMPRESSION) as zf:
+        yield from _write_zip_member(zf, stream, 'PSA_Data.xlsx', _build_psa_data_xlsx(data))
+        yield from _write_zip_member(zf, stream, 'Validation_Report.xlsx', report_future.result())
+    # Central directory is written when the ZIP closes
+    yield from stream.drain()
+
+
+def _write_zip_member(zf: zipfile.ZipFile, stream: _ChunkStream, filename: str, file_bytes: bytes) -> Iterator[bytes]:
+    """Add one file to the ZIP, yielding compressed output as it is produced."""
+    source = io.BytesIO(file_bytes)
+    with zf.open(filename, mode='w') as member:
+        for chunk in iter(lambda: source.read(ZIP_CHUNK_SIZE), b''):
+            member.write(chunk)
+            yield from stream.drain()
+    yield from stream.drain()
+
+
+class _ChunkStream:
+    """Write-only, unseekable file object that buffers ZIP output until drained."""
+    
+    def __init__(self):
+        self._chunks = []
     
-    print("[EXPORTER] Creating multi-tab Excel file...")
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
     
-    excel_files = {}
+    def flush(self) -> None:
+        pass
+    
+    def drain(self) -> Iterator[bytes]:
+        """Yield and clear everything written since the last drain."""
+        chunks, self._chunks = self._chunks, []
+        for chunk in chunks:
+            if chunk:
+                yield chunk
+
+
+def _build_psa_data_xlsx(data: Dict[str, Any]) -> bytes:
+    """Build PSA_Data.xlsx (Product + Planogram + Fixture sheets)."""
+    logger.debug("Creating multi-tab Excel file...")
     
     # Generate PSA_Data.xlsx with multiple sheets
     psa_data_out = io.BytesIO()
-    with pd.ExcelWriter(psa_data_out, engine='openpyxl') as writer:
-        
-        # Sheet 1: Product Data
-        if data['product_df'] is not None:
-            data['product_df'].to_excel(writer, sheet_name='Product', index=False)
-            ws_product = writer.sheets['Product']
-            _style_header(ws_product)
-            print(f"[EXPORTER] Added Product sheet ({len(data['product_df'])} rows, {len(data['product_df'].columns)} columns)")
-        
-        # Sheet 2: Planogram Data
-        if data['planogram_df'] is not None:
-            data['planogram_df'].to_excel(writer, sheet_name='Planogram', index=False)
-            ws_planogram = writer.sheets['Planogram']
-            _style_header(ws_planogram)
-            
-            # Highlight smart-mapped columns (7-10) in yellow
-            yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-            for col_idx in [8, 9, 10, 11]:  # Columns H, I, J, K
-                ws_planogram.cell(row=1, column=col_idx).fill = yellow_fill
-                ws_planogram.cell(row=1, column=col_idx).font = Font(bold=True, color="000000")
-            
-            print(f"[EXPORTER] Added Planogram sheet ({len(data['planogram_df'])} rows, {len(data['planogram_df'].columns)} columns)")
-        
-        # Sheet 3: Fixture Data
-        if data.get('fixture_df') is not None:
-            data['fixture_df'].to_excel(writer, sheet_name='Fixture', index=False)
-            ws_fixture = writer.sheets['Fixture']
-            _style_header(ws_fixture)
-            print(f"[EXPORTER] Added Fixture sheet ({len(data['fixture_df'])} rows, {len(data['fixture_df'].columns)} columns)")
-    
-    excel_files['PSA_Data.xlsx'] = psa_data_out.getvalue()
-    sheet_count = sum([1 for key in ['product_df', 'planogram_df', 'fixture_df'] if data.get(key) is not None])
-    print(f"[EXPORTER] Created PSA_Data.xlsx with {sheet_count} sheets ({len(excel_files['PSA_Data.xlsx'])} bytes)")
+    wb = xlsxwriter.Workbook(psa_data_out, PSA_DATA_WORKBOOK_OPTIONS)
+    header_formats = _add_header_formats(wb)
+    
+    # Sheet 1: Product Data
+    if data['product_df'] is not None:
+        _write_sheet(wb, 'Product', data['product_df'], header_formats)
+        logger.debug("Added Product sheet (%s rows, %s columns)", len(data['product_df']), len(data['product_df'].columns))
+    
+    # Sheet 2: Planogram Data
+    if data['planogram_df'] is not None:
+        # Highlight smart-mapped columns (7-10) in yellow
+        _write_sheet(wb, 'Planogram', data['planogram_df'], header_formats, highlight_columns=PLANOGRAM_HIGHLIGHT_COLUMNS)
+        logger.debug("Added Planogram sheet (%s rows, %s columns)", len(data['planogram_df']), len(data['planogram_df'].columns))
     
+    # Sheet 3: Fixture Data
+    if data.get('fixture_df') is not None:
+        _write_sheet(wb, 'Fixture', data['fixture_df'], header_formats)
+        logger.debug("Added Fixture sheet (%s rows, %s columns)", len(data['fixture_df']), len(data['fixture_df'].columns))
+    
+    wb.close()
+    
+    psa_data_bytes = psa_data_out.getvalue()
+    sheet_count = sum([1 for key in ['product_df', 'planogram_df', 'fixture_df'] if data.get(key) is not None])
+    logger.debug("Created PSA_Data.xlsx with %s sheets (%s bytes)", sheet_count, len(psa_data_bytes))
+    return psa_data_bytes
+
+
+def _build_validation_report_xlsx(data: Dict[str, Any]) -> bytes:
+    """Build Validation_Report.xlsx from the combined Product/Planogram/Fixture checks."""
     # Combine validation results
     all_validation_results = []
     combined_summary = {
@@ -86,44 +167,16 @@ def create_excel_export(data: Dict[str, Any]) -> bytes:
     if data.get('fixture_df') is not None:
         combined_summary['total_records'] += len(data['fixture_df'])
     
-    # Add Product validation
+    # Add each table's validation, prefixing checks with the table name
     if data['product_validation']:
-        # Prefix each check with table name
-        for result in data['product_validation']:
-            result.check_name = f"[Product] {result.check_name}"
-            # Sum up error counts
-            combined_summary['total_errors'] += result.error_count
-        all_validation_results.extend(data['product_validation'])
-        combined_summary['total_checks'] += data['product_summary']['total_checks']
-        combined_summary['passed'] += data['product_summary']['passed']
-        combined_summary['failed'] += data['product_summary']['failed']
-        combined_summary['warnings'] += data['product_summary']['warnings']
-    
-    # Add Planogram validation
+        _merge_validation('[Product] ', data['product_validation'], data['product_summary'],
+                          combined_summary, all_validation_results)
     if data['planogram_validation']:
-        # Prefix each check with table name
-        for result in data['planogram_validation']:
-            result.check_name = f"[Planogram] {result.check_name}"
-            # Sum up error counts
-            combined_summary['total_errors'] += result.error_count
-        all_validation_results.extend(data['planogram_validation'])
-        combined_summary['total_checks'] += data['planogram_summary']['total_checks']
-        combined_summary['passed'] += data['planogram_summary']['passed']
-        combined_summary['failed'] += data['planogram_summary']['failed']
-        combined_summary['warnings'] += data['planogram_summary']['warnings']
-    
-    # Add Fixture validation
+        _merge_validation('[Planogram] ', data['planogram_validation'], data['planogram_summary'],
+                          combined_summary, all_validation_results)
     if data.get('fixture_validation'):
-        # Prefix each check with table name
-        for result in data['fixture_validation']:
-            result.check_name = f"[Fixture] {result.check_name}"
-            # Sum up error counts
-            combined_summary['total_errors'] += result.error_count
-        all_validation_results.extend(data['fixture_validation'])
-        combined_summary['total_checks'] += data['fixture_summary']['total_checks']
-        combined_summary['passed'] += data['fixture_summary']['passed']
-        combined_summary['failed'] += data['fixture_summary']['failed']
-        combined_summary['warnings'] += data['fixture_summary']['warnings']
+        _merge_validation('[Fixture] ', data['fixture_validation'], data['fixture_summary'],
+                          combined_summary, all_validation_results)
     
     # Update overall status based on failures
     if combined_summary['failed'] > 0:
@@ -135,28 +188,73 @@ def create_excel_export(data: Dict[str, Any]) -> bytes:
     
     # Generate combined validation report
     validation_report_bytes = generate_validation_report(all_validation_results, combined_summary)
-    excel_files['Validation_Report.xlsx'] = validation_report_bytes
-    print(f"[EXPORTER] Created Validation_Report.xlsx with {combined_summary['total_checks']} total checks")
+    logger.debug("Created Validation_Report.xlsx with %s total checks", combined_summary['total_checks'])
+    return validation_report_bytes
+
+
+def _merge_validation(prefix: str, results: list, summary: Dict[str, Any],
+                      combined_summary: Dict[str, Any], all_results: list) -> None:
+    """Prefix one table's checks with its name and add them to the combined report.
     
-    # Create ZIP
-    zip_out = io.BytesIO()
-    with zipfile.ZipFile(zip_out, mode='w', compression=zipfile.ZIP_DEFLATED) as zf:
-        for filename, file_bytes in excel_files.items():
-            zf.writestr(filename, file_bytes)
+    Args:
+        prefix: Table prefix for check names, e.g. '[Product] '
+        results: That table's ValidationResult list
+        summary: That table's summary dict
+        combined_summary: Combined summary to add the counts to
+        all_results: Combined result list to extend
+    """
+    combined_summary['total_errors'] += sum(result.error_count for result in results)
+    # Results are frozen (and may be shared with the extraction cache) - add
+    # prefixed copies
+    all_results.extend(replace(result, check_name=prefix + result.check_name) for result in results)
+    for key in ('total_checks', 'passed', 'failed', 'warnings'):
+        combined_summary[key] += summary[key]
+
+
+def _write_sheet(
+    wb: xlsxwriter.Workbook,
+    sheet_name: str,
+    df: pd.DataFrame,
+    header_formats: Dict[str, Any],
+    highlight_columns=()
+) -> None:
+    """Write a DataFrame to a constant_memory workbook with a styled header row.
     
-    zip_bytes = zip_out.getvalue()
-    print(f"[EXPORTER] Generated ZIP ({len(zip_bytes)} bytes) with 2 files: PSA_Data.xlsx + Validation_Report.xlsx")
+    Rows are written strictly top to bottom, which constant_memory requires
+    (pandas' to_excel writes column by column and would drop cells).
     
-    return zip_bytes
+    Args:
+        wb: xlsxwriter Workbook opened with constant_memory=True
+        sheet_name: Name of the sheet to create
+        df: DataFrame to write (index is not written)
+        header_formats: Formats from _add_header_formats
+        highlight_columns: 1-based column numbers whose header gets the yellow fill
+    """
+    ws = wb.add_worksheet(sheet_name)
+    
+    # Header row
+    for col_idx, col_name in enumerate(df.columns):
+        fmt = header_formats['highlight'] if col_idx + 1 in highlight_columns else header_formats['header']
+        ws.write(0, col_idx, col_name, fmt)
+    
+    # Data rows - convert the whole frame to a list of lists in one pass rather
+    # than checking every cell for NaN in Python
+    values = df.to_numpy(dtype=object)
+    if pd.isna(values).any():
+        values = df.astype(object).where(df.notna(), None).to_numpy()
+    for row_idx, row in enumerate(values.tolist(), start=1):
+        ws.write_row(row_idx, 0, row)
 
 
-def _style_header(ws):
-    """Apply Walmart blue styling to header row."""
-    header_fill = PatternFill(start_color="0053E2", end_color="0053E2", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-    header_alignment = Alignment(horizontal='center', vertical='center')
-    
-    for cell in ws[1]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
+def _add_header_formats(wb: xlsxwriter.Workbook) -> Dict[str, Any]:
+    """Create the Walmart blue header and yellow highlight formats once per workbook."""
+    return {
+        'header': wb.add_format({
+            'bold': True, 'bg_color': '#0053E2', 'font_color': '#FFFFFF',
+            'align': 'center', 'valign': 'vcenter'
+        }),
+        'highlight': wb.add_format({
+            'bold': True, 'bg_color': '#FFFF00', 'font_color': '#000000',
+            'align': 'center', 'valign': 'vcenter'
+        }),
+    }
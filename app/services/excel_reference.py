@@ -0,0 +1,31 @@
+"""Read the 'handoff' sheet of the Excel reference file."""
+from __future__ import annotations
+
+import io
+from functools import lru_cache
+
+import pandas as pd
+
+# Parsed Excel reference sheets kept (LRU, keyed by file content) - the same
+# reference file is used by the Product and Planogram validators of an upload,
+# and is usually uploaded with many PSA files
+EXCEL_REFERENCE_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=EXCEL_REFERENCE_CACHE_SIZE)
+def _read_reference_sheet(excel_reference_bytes: bytes) -> pd.DataFrame:
+    """Parse the 'handoff' sheet of one distinct Excel reference file."""
+    return pd.read_excel(io.BytesIO(excel_reference_bytes), sheet_name='handoff')
+
+
+def read_reference_sheet(excel_reference_bytes: bytes) -> pd.DataFrame:
+    """Parse the 'handoff' sheet of an Excel reference file, once per distinct file.
+    
+    Args:
+        excel_reference_bytes: Raw Excel reference file bytes (bytes or any buffer)
+    
+    Returns:
+        DataFrame of the 'handoff' sheet - shared between callers, so it must
+        not be modified. Read failures raise and are not cached.
+    """
+    return _read_reference_sheet(bytes(excel_reference_bytes))
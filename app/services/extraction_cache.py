@@ -0,0 +1,81 @@
+"""In-memory cache of table extraction results, keyed by input file content."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Most recent extraction results kept (LRU) across all stages - repeated
+# uploads of the same file skip the whole read/map/validate pipeline
+EXTRACTION_CACHE_SIZE = 32
+
+ExtractionResult = Tuple[pd.DataFrame, List, dict]
+
+_extraction_cache: OrderedDict = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+
+def _content_digest(data: Optional[bytes]) -> Optional[bytes]:
+    """SHA-256 digest of a file's bytes, None when there is no file."""
+    if data is None:
+        return None
+    return hashlib.sha256(data).digest()
+
+
+def _copy_result(result: ExtractionResult) -> ExtractionResult:
+    """Copy a cached result so callers can never modify the cached one.
+    
+    The ValidationResult objects are frozen, so only the list holding them
+    is copied.
+    """
+    df, validation_results, summary = result
+    return df.copy(), list(validation_results), dict(summary)
+
+
+def cached_extraction(
+    stage: str,
+    extract: Callable[[], ExtractionResult],
+    psa_bytes: bytes,
+    excel_reference_bytes: Optional[bytes] = None,
+    key_extra: tuple = ()
+) -> ExtractionResult:
+    """Return the extraction result for a stage, running extract only on a miss.
+    
+    Entries are keyed by (stage, SHA-256 of the PSA bytes, SHA-256 of the
+    Excel reference bytes, *key_extra), so every table extracted from the same
+    upload shares one cache. Failed extractions raise and are not cached.
+    
+    Args:
+        stage: Name of the extraction stage (e.g. 'planogram', 'fixture')
+        extract: Runs the uncached extraction
+        psa_bytes: Raw PSA file bytes the result depends on
+        excel_reference_bytes: Optional Excel reference file bytes the result depends on
+        key_extra: Any other inputs the result depends on
+    
+    Returns:
+        Copy of the (DataFrame, validation_results, summary) result
+    """
+    cache_key = (stage, _content_digest(psa_bytes), _content_digest(excel_reference_bytes)) + key_extra
+    with _extraction_cache_lock:
+        cached = _extraction_cache.get(cache_key)
+        if cached is not None:
+            _extraction_cache.move_to_end(cache_key)
+    if cached is not None:
+        logger.debug("Using cached %s extraction result", stage)
+        return _copy_result(cached)
+    
+    result = extract()
+    
+    with _extraction_cache_lock:
+        _extraction_cache[cache_key] = result
+        _extraction_cache.move_to_end(cache_key)
+        while len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+            _extraction_cache.popitem(last=False)
+    
+    return _copy_result(result)
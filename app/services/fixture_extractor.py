@@ -1,16 +1,23 @@
 """Extract Fixture data from PSA files."""
 from __future__ import annotations
 
+import logging
 from typing import Tuple, List
 import pandas as pd
 
+from app.services.extraction_cache import cached_extraction
 from app.services.fixture_mapper import extract_and_map_fixture
 from app.services.fixture_validator import ValidationResult
 
+logger = logging.getLogger(__name__)
+
 
 def extract_fixture_data(psa_bytes: bytes) -> Tuple[pd.DataFrame, List[ValidationResult], dict]:
     """Extract and validate Fixture data.
     
+    Results are cached per PSA content (see extraction_cache), so a file
+    that was already processed is not read, mapped and validated again.
+    
     Args:
         psa_bytes: Raw PSA file bytes
         
@@ -18,12 +25,16 @@ def extract_fixture_data(psa_bytes: bytes) -> Tuple[pd.DataFrame, List[Validatio
         Tuple of (DataFrame, validation_results, summary)
     """
     
-    print("[FIXTURE] Starting extraction and validation...")
+    logger.debug("Starting extraction and validation...")
     
     # Use the mapper which handles extraction, mapping, and validation
-    df, validation_results, summary = extract_and_map_fixture(psa_bytes)
+    df, validation_results, summary = cached_extraction(
+        'fixture',
+        lambda: extract_and_map_fixture(psa_bytes),
+        psa_bytes
+    )
     
-    print(f"[FIXTURE] Extraction complete: {len(df)} rows, {len(df.columns)} columns")
-    print(f"[FIXTURE] Validation summary: {summary['passed']} passed, {summary['failed']} failed")
+    logger.debug("Extraction complete: %s rows, %s columns", len(df), len(df.columns))
+    logger.debug("Validation summary: %s passed, %s failed", summary['passed'], summary['failed'])
     
     return df, validation_results, summary
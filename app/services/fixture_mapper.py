@@ -6,13 +6,19 @@ Process:
 3. Trim to only the 15 fields we need
 4. Rename to clean business names
 """
-import pandas as pd
+import logging
 from typing import List, Tuple
 
-from app.services.fixture_validator import validate_fixture_data, ValidationResult
+import numpy as np
+import pandas as pd
+
+from app.services.fixture_psa_reader import (
+    parse_fixture_fields,
+    read_fixture_lines_from_bytes,
+)
+from app.services.fixture_validator import EXPECTED_FIELD_COUNT, validate_fixture_data, ValidationResult
 
-# Expected field count from PSA files
-EXPECTED_FIELD_COUNT = 166  # Field_0 through Field_165
+logger = logging.getLogger(__name__)
 
 # Define the field mapping (original Field_X → clean name)
 FIXTURE_FIELD_MAPPING = {
@@ -52,6 +58,10 @@ FIELDS_TO_KEEP = [
     'Field_104'  # Proof_Notes
 ]
 
+# Positions of FIELDS_TO_KEEP in a raw Fixture row, and their clean names
+FIELD_INDICES = [int(field.split('_')[1]) for field in FIELDS_TO_KEEP]
+CLEAN_NAMES = [FIXTURE_FIELD_MAPPING[field] for field in FIELDS_TO_KEEP]
+
 # Type code mapping (numeric to text)
 TYPE_CODE_MAPPING = {
     '0': 'Shelf',
@@ -66,13 +76,10 @@ def extract_and_map_fixture(psa_bytes: bytes) -> Tuple[pd.DataFrame, List[Valida
     """Extract Fixture table from PSA bytes, validate, and apply mapping.
     
     Steps:
-    1. Read all Fixture rows from PSA bytes
-    2. Validate field count (must be 166 fields)
-    3. Create DataFrame with all fields (Field_0, Field_1, ...)
-    4. Trim to only needed fields
-    5. Rename to clean names
-    6. Map Type codes to text
-    7. Run full validation
+    1. Read all Fixture rows from PSA bytes (once)
+    2. Parse only the needed fields, under clean names
+    3. Map Type codes to text
+    4. Run all validations in one pass (field count must be 166 fields)
     
     Args:
         psa_bytes: Raw PSA file content as bytes
@@ -81,74 +88,67 @@ def extract_and_map_fixture(psa_bytes: bytes) -> Tuple[pd.DataFrame, List[Valida
         Tuple of (DataFrame, validation_results, summary)
     """
     
-    print("[FIXTURE MAPPER] Starting extraction...")
-    
-    # Step 1: Decode and read all Fixture rows
-    try:
-        content = psa_bytes.decode('utf-8', errors='ignore')
-    except Exception:
-        content = psa_bytes.decode('latin-1', errors='ignore')
-    
-    lines = content.split('\n')
+    logger.debug("Starting extraction...")
     
-    fixture_rows = []
-    for line in lines:
-        line = line.strip()
-        if line.startswith('Fixture,'):
-            parts = line.split(',')
-            fixture_data = parts[1:]  # Skip "Fixture" table name
-            fixture_rows.append(fixture_data)
+    # Step 1: Read all Fixture lines once (raw bytes, with the widest field count)
+    fixture_lines, max_cols = read_fixture_lines_from_bytes(psa_bytes)
     
-    print(f"[FIXTURE MAPPER] Found {len(fixture_rows)} rows")
+    logger.debug("Found %s rows", len(fixture_lines))
     
-    if not fixture_rows:
+    if not fixture_lines:
         raise ValueError("No Fixture rows found in PSA file")
     
-    # Step 2: Run initial validation (Field_Count only)
-    initial_validation, _ = validate_fixture_data(fixture_rows, df=None)
+    # Step 2-4: Build the cleaned DataFrame - only when the rows have the
+    # expected layout, otherwise the kept field positions mean nothing
+    df_renamed = None
+    if max_cols == EXPECTED_FIELD_COUNT:
+        df_renamed = _build_fixture_frame(fixture_lines, max_cols)
     
-    # Check if Field_Count validation failed
-    field_count_check = next((r for r in initial_validation if r.check_name == 'Field_Count'), None)
+    # Step 5: Run all validations in one pass (Field_Count first - the
+    # field-level checks only run on a DataFrame)
+    validation_results, validation_summary = validate_fixture_data(fixture_lines, df=df_renamed, max_cols=max_cols)
+    
+    field_count_check = next((r for r in validation_results if r.check_name == 'Field_Count'), None)
     if field_count_check and not field_count_check.passed:
         raise ValueError(f"Validation failed: {field_count_check.message}")
     
-    # Step 3: Create DataFrame with ALL fields (validation passed)
-    max_cols = max(len(row) for row in fixture_rows)
-    
-    all_field_names = [f'Field_{i}' for i in range(max_cols)]
-    
-    # Pad rows to match max columns
-    padded_rows = [row + [''] * (max_cols - len(row)) for row in fixture_rows]
-    df_all = pd.DataFrame(padded_rows, columns=all_field_names)
-    
-    print(f"[FIXTURE MAPPER] Extracted all fields: {len(df_all.columns)} columns")
-    
-    # Step 4: Trim to only needed fields
-    df_trimmed = df_all[FIELDS_TO_KEEP].copy()
-    
-    print(f"[FIXTURE MAPPER] Trimmed to {len(df_trimmed.columns)} needed fields")
+    return df_renamed, validation_results, validation_summary
+
+
+def _build_fixture_frame(fixture_lines: List[bytes], max_cols: int) -> pd.DataFrame:
+    """Parse the needed fields of raw Fixture lines into the cleaned DataFrame.
     
-    # Step 5: Rename to clean names
-    df_renamed = df_trimmed.rename(columns=FIXTURE_FIELD_MAPPING)
+    Args:
+        fixture_lines: Raw Fixture lines from read_fixture_lines_from_bytes
+        max_cols: Field count of the widest line
+        
+    Returns:
+        DataFrame with Table_Name, the clean field names, and text Type values
+    """
+    # Parse only the needed fields (C parser skips the rest) and name them
+    df_renamed = parse_fixture_fields(fixture_lines, FIELD_INDICES, max_cols)
+    df_renamed.columns = CLEAN_NAMES
     
-    print(f"[FIXTURE MAPPER] Renamed to clean names")
-    print(f"[FIXTURE MAPPER] Final columns: {list(df_renamed.columns)}")
+    logger.debug("Trimmed to %s needed fields", len(df_renamed.columns))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Final columns: %s", df_renamed.columns.tolist())
     
-    # Step 6: Map Type codes to text values
+    # Map Type codes to text values
     if 'Type' in df_renamed.columns:
-        # Convert Type values from numeric codes to text
-        df_renamed['Type'] = df_renamed['Type'].astype(str).map(
-            lambda x: TYPE_CODE_MAPPING.get(x.strip(), x)  # Use mapping or keep original if not found
-        )
-        print(f"[FIXTURE MAPPER] Mapped Type codes to text values")
-        print(f"[FIXTURE MAPPER] Type values: {df_renamed['Type'].value_counts().to_dict()}")
-    
-    # Step 7: Add Table_Name column as FIRST column (for consistency with Product/Planogram)
-    df_renamed.insert(0, 'Table_Name', 'Fixture')
-    print(f"[FIXTURE MAPPER] Added Table_Name column as first column")
-    print(f"[FIXTURE MAPPER] Final column order: {list(df_renamed.columns)}")
-    
-    # Step 8: Run full validation on cleaned DataFrame (including Unique_Name)
-    validation_results, validation_summary = validate_fixture_data(fixture_rows, df=df_renamed)
-    
-    return df_renamed, validation_results, validation_summary
+        # Convert Type values from numeric codes to text (dict lookup in pandas,
+        # no per-row Python callback); keep original value if not found.
+        # Only a handful of distinct values remain, so store them as categories.
+        type_values = df_renamed['Type'].astype(str)
+        df_renamed['Type'] = type_values.str.strip().map(TYPE_CODE_MAPPING).fillna(type_values).astype('category')
+        logger.debug("Mapped Type codes to text values")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Type values: %s", df_renamed['Type'].value_counts().to_dict())
+    
+    # Add Table_Name column as FIRST column (for consistency with Product/Planogram)
+    df_renamed.insert(0, 'Table_Name', pd.Categorical.from_codes(
+        np.zeros(len(df_renamed), dtype=np.int8), categories=['Fixture']))
+    logger.debug("Added Table_Name column as first column")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Final column order: %s", df_renamed.columns.tolist())
+    
+    return df_renamed
@@ -1,32 +1,89 @@
 """Read Fixture rows from PSA file bytes."""
-from typing import List
+import csv
+import io
+import logging
+import re
+from typing import List, Sequence, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# A Fixture line (leading whitespace allowed, as line.strip() did) - captures
+# everything after "Fixture," so non-Fixture lines are never decoded or split
+_FIXTURE_ROW_PATTERN = re.compile(rb'^[ \t\r\f\v]*Fixture,([^\n]*)', re.MULTILINE)
+
+
+def read_fixture_lines_from_bytes(psa_bytes: bytes) -> Tuple[List[bytes], int]:
+    """Extract the raw Fixture lines from PSA file bytes.
+
+    Args:
+        psa_bytes: Raw PSA file content (bytes or any buffer, e.g. an mmap)
+
+    Returns:
+        Tuple of (Fixture lines as bytes - without the leading "Fixture,"
+        table name and without trailing whitespace - and the field count of
+        the widest line, 0 if there are none)
+    """
+    fixture_lines = [match.group(1).rstrip() for match in _FIXTURE_ROW_PATTERN.finditer(psa_bytes)]
+    max_cols = max((line.count(b',') for line in fixture_lines), default=-1) + 1
+
+    logger.debug("Found %s Fixture rows", len(fixture_lines))
+    return fixture_lines, max_cols
 
 
 def read_fixture_rows_from_bytes(psa_bytes: bytes) -> List[List[str]]:
     """Extract Fixture rows from PSA file bytes.
-    
+
+    Scans the raw bytes for Fixture lines instead of decoding and splitting
+    the whole file, so only the matching lines are ever turned into strings.
+
     Args:
-        psa_bytes: Raw PSA file content
-        
+        psa_bytes: Raw PSA file content (bytes or any buffer, e.g. an mmap)
+
+    Returns:
+        List of Fixture rows (each row is a list of field values, without
+        the leading "Fixture" table name)
+    """
+    return [
+        line.decode('utf-8', errors='ignore').split(',')
+        for line in read_fixture_lines_from_bytes(psa_bytes)[0]
+    ]
+
+
+def parse_fixture_fields(fixture_lines: List[bytes], field_indices: Sequence[int],
+                         field_count: int) -> pd.DataFrame:
+    """Parse only the selected field positions out of raw Fixture lines.
+
+    Uses pandas' C parser with usecols, so the unused fields are skipped in C
+    instead of being split into Python strings first. Fields are split on
+    plain commas (no quote handling) exactly like str.split(','), and missing
+    trailing fields come back as ''.
+
+    Args:
+        fixture_lines: Raw Fixture lines from read_fixture_lines_from_bytes
+        field_indices: Field positions to keep, in output column order
+        field_count: Field count of the widest line
+
     Returns:
-        List of Fixture rows (each row is a list of field values)
+        DataFrame of strings with one column per field index (named by index)
     """
-    try:
-        content = psa_bytes.decode('utf-8', errors='ignore')
-    except Exception:
-        content = psa_bytes.decode('latin-1', errors='ignore')
-    
-    lines = content.split('\n')
-    fixture_rows = []
-    
-    for line in lines:
-        line = line.strip()
-        if line.startswith('Fixture,'):
-            # Split by comma
-            parts = line.split(',')
-            # Remove the "Fixture" table name from the beginning
-            row_data = parts[1:]  # Skip "Fixture" itself
-            fixture_rows.append(row_data)
-    
-    print(f"[INFO] Found {len(fixture_rows)} Fixture rows")
-    return fixture_rows
+    width = max(field_count, max(field_indices) + 1)
+    df = pd.read_csv(
+        io.BytesIO(b'\n'.join(fixture_lines)),
+        header=None,
+        names=range(width),
+        usecols=field_indices,
+        dtype=str,
+        na_filter=False,
+        quoting=csv.QUOTE_NONE,
+        skip_blank_lines=False,
+        encoding='utf-8',
+        encoding_errors='ignore',
+    )
+    # usecols keeps file order - put the columns back in the requested order,
+    # without a copy when they already are (e.g. ascending FIELD_INDICES)
+    field_indices = list(field_indices)
+    if df.columns.tolist() == field_indices:
+        return df
+    return df[field_indices]
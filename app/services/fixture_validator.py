@@ -3,12 +3,51 @@
 Validations:
 1. Field_Count: Ensure PSA has exactly 166 fields (Field_0 to Field_165)
 """
+import logging
+from collections import Counter
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Expected field count from PSA files
+EXPECTED_FIELD_COUNT = 166  # Field_0 through Field_165
+
+# Expected dimensions for each fixture Type
+TYPE_DIMENSIONS = {
+    'Shelf': {'Width': 48, 'Depth': 24},
+    'Rod': {'Width': 0.5, 'Depth': 21},
+    'Bar': {'Width': 48, 'Depth': 0.5},
+    'Pegboard': {'Width': 46, 'Depth': 0.25}
+    # Obstruction - no validation rules
+}
+
+# TYPE_DIMENSIONS as lookup Series (Type -> expected value), built once for
+# vectorized per-row gathers; Types without rules map to NaN
+EXPECTED_WIDTHS = pd.Series({t: dims['Width'] for t, dims in TYPE_DIMENSIONS.items()}, dtype=float)
+EXPECTED_DEPTHS = pd.Series({t: dims['Depth'] for t, dims in TYPE_DIMENSIONS.items()}, dtype=float)
+
+# Tolerance for floating point comparisons of expected values
+FLOAT_TOLERANCE = 0.01
+
+# Failed records listed in a result's details (the rest are only counted)
+MAX_DETAIL_ROWS = 10
+
+# Numeric columns checked by the Shelf validations
+SHELF_NUMERIC_COLUMNS = ['Y', 'Z', 'Left_Overhang', 'Right_Overhang', 'Front_Overhang', 'Back_Overhang']
+
+# Overhangs that must be 0 on every Shelf, and the message for each error code
+SHELF_OVERHANG_COLUMNS = ['Left_Overhang', 'Right_Overhang', 'Front_Overhang']
+OVERHANG_ERROR_FORMATS = {
+    1: '{col} is null/blank',
+    2: '{col} is not a number',
+    3: '{col}={value}'
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of a single validation check."""
     check_name: str
@@ -24,16 +63,184 @@ class ValidationResult:
         return self.status == 'PASS'
 
 
-def validate_field_count(fixture_rows: List[List[str]]) -> ValidationResult:
+def _blank_mask(values: pd.Series) -> pd.Series:
+    """True where a value is null or blank (same as pd.isna(v) or str(v).strip() == '')."""
+    codes, uniques = pd.factorize(values.astype(str))
+    blank = np.array([value.strip() == '' for value in uniques], dtype=bool)
+    return values.isna() | pd.Series(blank[codes], index=values.index)
+
+
+def _abs_diff(values, expected) -> np.ndarray:
+    """abs(values - expected) as a float array, computed in a single buffer.
+    
+    Args:
+        values: Parsed numbers (Series or array)
+        expected: Expected value(s) - scalar, Series or array of the same length
+        
+    Returns:
+        Array of absolute differences (NaN where either side is NaN)
+    """
+    diff = np.subtract(np.asarray(values, dtype=float), np.asarray(expected, dtype=float))
+    return np.abs(diff, out=diff)
+
+
+def _detail_mask(failed_mask: np.ndarray) -> np.ndarray:
+    """Limit a failure mask to its first MAX_DETAIL_ROWS failures (the ones listed in details)."""
+    return failed_mask & (np.cumsum(failed_mask) <= MAX_DETAIL_ROWS)
+
+
+def _coerce_numeric_column(values: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """Convert a column with float(str(v).strip()) semantics, without a per-row loop.
+    
+    Each distinct value is stripped and converted once and taken back onto the
+    column by its factorized code, so inputs such as ' 48 ' or 'inf' parse
+    exactly as they would row by row. The distinct values are converted in a
+    single NumPy cast; only a column holding unparseable text falls back to
+    trying them one at a time. The blank mask comes out of the same pass, so
+    a numeric column is factorized and stripped only once per validation run.
+    
+    Args:
+        values: Column to convert
+        
+    Returns:
+        Tuple of (float Series - NaN where conversion fails, mask of values
+        that converted, mask of null/blank values as in _blank_mask)
+    """
+    codes, uniques = pd.factorize(values.astype(str))
+    stripped = [value.strip() for value in uniques]
+    blank = np.array([value == '' for value in stripped], dtype=bool)
+    converted = np.ones(len(stripped), dtype=bool)
+    try:
+        parsed = np.array(stripped, dtype=object).astype(float)
+    except ValueError:
+        parsed = np.empty(len(stripped))
+        for i, value in enumerate(stripped):
+            try:
+                parsed[i] = float(value)
+            except ValueError:
+                parsed[i] = np.nan
+                converted[i] = False
+    return (
+        pd.Series(parsed[codes], index=values.index),
+        pd.Series(converted[codes], index=values.index),
+        values.isna() | pd.Series(blank[codes], index=values.index)
+    )
+
+
+@dataclass
+class ValidationView:
+    """Normalized Type/Name columns shared by the fixture validators."""
+    type: Optional[pd.Series]        # str(Type).strip(), None if no Type column
+    name: Optional[pd.Series]        # str(Name).strip(), None if no Name column
+    is_deck: Optional[np.ndarray]    # Stripped Name starts with 'DECK' (any case)
+
+
+def _strip_strings(values: pd.Series) -> pd.Series:
+    """Same as values.astype(str).str.strip(), stripping each category only once.
+    
+    Categorical columns (such as the mapped Type) hold a handful of distinct
+    values, so the strings are built per category and taken by code.
+    
+    Args:
+        values: Column to normalize
+        
+    Returns:
+        Object Series of stripped strings (same index)
+    """
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return values.astype(str).str.strip()
+    
+    # Code -1 (missing) picks the trailing 'nan', as str(nan) would
+    categories = values.cat.categories.astype(str).str.strip().to_numpy(dtype=object)
+    stripped = np.append(categories, 'nan')[values.cat.codes.to_numpy()]
+    return pd.Series(stripped, index=values.index, dtype=object)
+
+
+def prepare_validation_view(df: pd.DataFrame) -> ValidationView:
+    """Normalize the Type and Name columns once for all validators.
+    
+    Args:
+        df: DataFrame with mapped/cleaned fixture data
+        
+    Returns:
+        ValidationView over df (same index)
+    """
+    types = _strip_strings(df['Type']) if 'Type' in df.columns else None
+    names = _strip_strings(df['Name']) if 'Name' in df.columns else None
+    # DECK prefix check once per run - only the first 4 characters need
+    # upper-casing (each character upper-cases to at least one character)
+    is_deck = None
+    if names is not None:
+        is_deck = names.str[:4].str.upper().str.startswith('DECK').to_numpy(dtype=bool)
+    return ValidationView(
+        type=types,
+        name=names,
+        is_deck=is_deck
+    )
+
+
+@dataclass
+class ShelfFrame:
+    """Shelf rows of a fixture DataFrame, with their numeric columns parsed once."""
+    rows: pd.DataFrame       # Shelf rows (original index and values)
+    names: pd.Series         # Stripped Name of each Shelf row
+    is_deck: np.ndarray      # True where Name starts with 'DECK'
+    numbers: pd.DataFrame    # Parsed values, NaN where conversion fails
+    converted: pd.DataFrame  # True where the value converted to a number
+    is_blank: pd.DataFrame   # True where the value is null or blank
+
+
+def _shelf_numeric_frame(df: pd.DataFrame, view: Optional[ValidationView] = None) -> ShelfFrame:
+    """Select the Shelf rows once and parse every shelf-checked column.
+    
+    Shared by the shelf validators so the Shelf/DECK masks and the string to
+    float conversions are done a single time, not once per check.
+    
+    Args:
+        df: DataFrame with a 'Type' column
+        view: Normalized Type/Name columns of df (computed if omitted)
+        
+    Returns:
+        ShelfFrame for the rows with Type = 'Shelf'
+    """
+    if view is None:
+        view = prepare_validation_view(df)
+    shelf_mask = (view.type == 'Shelf').to_numpy()
+    rows = df[shelf_mask]
+    
+    if view.name is not None:
+        names = view.name[shelf_mask]
+        is_deck = view.is_deck[shelf_mask]
+    else:
+        names = pd.Series('N/A', index=rows.index)
+        is_deck = np.zeros(len(rows), dtype=bool)
+    
+    numbers, converted, is_blank = {}, {}, {}
+    for column in SHELF_NUMERIC_COLUMNS:
+        if column in rows.columns:
+            numbers[column], converted[column], is_blank[column] = _coerce_numeric_column(rows[column])
+    
+    return ShelfFrame(
+        rows=rows,
+        names=names,
+        is_deck=is_deck,
+        numbers=pd.DataFrame(numbers, index=rows.index),
+        converted=pd.DataFrame(converted, index=rows.index),
+        is_blank=pd.DataFrame(is_blank, index=rows.index)
+    )
+
+
+def validate_field_count(fixture_rows: List[List[str]], max_cols: Optional[int] = None) -> ValidationResult:
     """Validate that PSA file has exactly 166 fields (Field_0 to Field_165).
     
     Args:
         fixture_rows: List of Fixture rows (each row is a list of field values)
+        max_cols: Field count of the widest row, if the caller already knows it
+            (only len(fixture_rows) is used then)
         
     Returns:
         ValidationResult with pass/fail status
     """
-    EXPECTED_FIELD_COUNT = 166
     total_rows = len(fixture_rows)
     
     if not fixture_rows:
@@ -47,7 +254,14 @@ def validate_field_count(fixture_rows: List[List[str]]) -> ValidationResult:
         )
     
     # Check field count
-    max_cols = max(len(row) for row in fixture_rows)
+    if max_cols is None:
+        # Happy path: every row has the expected width (one C-level count);
+        # the maximum is only taken when some row differs
+        row_lengths = list(map(len, fixture_rows))
+        if row_lengths.count(EXPECTED_FIELD_COUNT) == total_rows:
+            max_cols = EXPECTED_FIELD_COUNT
+        else:
+            max_cols = max(row_lengths)
     
     if max_cols != EXPECTED_FIELD_COUNT:
         return ValidationResult(
@@ -98,35 +312,42 @@ def validate_unique_names(df: pd.DataFrame) -> ValidationResult:
     failed_rows = []
     
     # Check 1: Find empty/blank names
-    empty_mask = df['Name'].isna() | (df['Name'].astype(str).str.strip() == '')
-    empty_rows = df[empty_mask]
+    empty_mask = _blank_mask(df['Name'])
+    empty_positions = np.flatnonzero(empty_mask.to_numpy())
+    empty_count = len(empty_positions)
     
-    for idx in empty_rows.index:
+    for idx in df.index[empty_positions[:MAX_DETAIL_ROWS]]:
         failed_rows.append({
             'row': idx + 2,  # +2 for Excel (1-indexed + header)
             'name': '<EMPTY>',
             'reason': 'Empty/blank name'
         })
     
-    # Check 2: Find duplicate names (only check non-empty names)
-    non_empty_df = df[~empty_mask].copy()
-    if len(non_empty_df) > 0:
-        # Count occurrences of each name
-        name_counts = non_empty_df['Name'].value_counts()
+    # Check 2: Find duplicate names (only check non-empty names) - all
+    # duplicated rows in one hashtable pass over the column itself, no
+    # filtered copy unless there is something to report
+    names = df['Name']
+    dup_mask = names.duplicated(keep=False).to_numpy() & ~empty_mask.to_numpy()
+    dup_count = int(dup_mask.sum())
+    if dup_count > 0 and len(failed_rows) < MAX_DETAIL_ROWS:
+        # Count occurrences of each name (order of this drives the report order)
+        name_counts = names[~empty_mask].value_counts()
         duplicates = name_counts[name_counts > 1]
         
-        if len(duplicates) > 0:
-            # For each duplicate name, find all rows with that name
-            for dup_name in duplicates.index:
-                dup_rows = non_empty_df[non_empty_df['Name'] == dup_name]
-                for idx in dup_rows.index:
-                    failed_rows.append({
-                        'row': idx + 2,
-                        'name': str(dup_name)[:50],  # Truncate if long
-                        'reason': f'Duplicate name (appears {duplicates[dup_name]} times)'
-                    })
+        # Group by name in name_counts order, in row order within each name
+        dup_names = names[dup_mask]
+        group_order = dup_names.map(pd.Series(np.arange(len(duplicates)), index=duplicates.index))
+        dup_names = dup_names.iloc[np.argsort(group_order.to_numpy(), kind='stable')]
+        
+        dup_counts = duplicates.to_dict()
+        for idx, dup_name in dup_names.iloc[:MAX_DETAIL_ROWS - len(failed_rows)].items():
+            failed_rows.append({
+                'row': idx + 2,
+                'name': str(dup_name)[:50],  # Truncate if long
+                'reason': f'Duplicate name (appears {dup_counts[dup_name]} times)'
+            })
     
-    error_count = len(failed_rows)
+    error_count = empty_count + dup_count
     pass_count = total_rows - error_count
     
     if error_count == 0:
@@ -143,22 +364,19 @@ def validate_unique_names(df: pd.DataFrame) -> ValidationResult:
         details_lines = [f"Total fixtures with name issues: {error_count}/{total_rows}"]
         
         # Count empty vs duplicate
-        empty_count = sum(1 for f in failed_rows if f['reason'].startswith('Empty'))
-        dup_count = error_count - empty_count
-        
         if empty_count > 0:
             details_lines.append(f"  - Empty/blank names: {empty_count}")
         if dup_count > 0:
             details_lines.append(f"  - Duplicate names: {dup_count}")
         
-        details_lines.append("\nFailed Records (showing first 10):")
-        for fail in failed_rows[:10]:
+        details_lines.append(f"\nFailed Records (showing first {MAX_DETAIL_ROWS}):")
+        for fail in failed_rows:
             details_lines.append(
                 f"  Row {fail['row']}: Name='{fail['name']}' - {fail['reason']}"
             )
         
-        if len(failed_rows) > 10:
-            details_lines.append(f"  ... and {len(failed_rows) - 10} more")
+        if error_count > MAX_DETAIL_ROWS:
+            details_lines.append(f"  ... and {error_count - MAX_DETAIL_ROWS} more")
         
         result = ValidationResult(
             check_name=check_name,
@@ -172,7 +390,7 @@ def validate_unique_names(df: pd.DataFrame) -> ValidationResult:
     return result
 
 
-def validate_type_dimensions(df: pd.DataFrame) -> ValidationResult:
+def validate_type_dimensions(df: pd.DataFrame, view: Optional[ValidationView] = None) -> ValidationResult:
     """Validate that fixture dimensions match expected values for each Type.
     
     Requirements:
@@ -184,6 +402,7 @@ def validate_type_dimensions(df: pd.DataFrame) -> ValidationResult:
     
     Args:
         df: DataFrame with 'Type', 'Width', and 'Depth' columns
+        view: Normalized Type/Name columns from prepare_validation_view (computed if omitted)
         
     Returns:
         ValidationResult with pass/fail status
@@ -203,80 +422,95 @@ def validate_type_dimensions(df: pd.DataFrame) -> ValidationResult:
             details="Cannot validate - required columns do not exist"
         )
     
-    # Define expected dimensions for each type
-    TYPE_DIMENSIONS = {
-        'Shelf': {'Width': 48, 'Depth': 24},
-        'Rod': {'Width': 0.5, 'Depth': 21},
-        'Bar': {'Width': 48, 'Depth': 0.5},
-        'Pegboard': {'Width': 46, 'Depth': 0.25}
-        # Obstruction - no validation rules
-    }
-    
     total_rows = len(df)
     failed_rows = []
     
-    for idx, row in df.iterrows():
-        fixture_type = str(row['Type']).strip()
-        width_val = row['Width']
-        depth_val = row['Depth']
-        name = row.get('Name', 'N/A')
-        
-        # Check for null/blank Width or Depth
-        width_is_null = pd.isna(width_val) or str(width_val).strip() == ''
-        depth_is_null = pd.isna(depth_val) or str(depth_val).strip() == ''
-        
-        if width_is_null or depth_is_null:
-            failed_rows.append({
-                'row': idx + 2,
-                'name': str(name)[:30],
-                'type': fixture_type,
-                'width': '<NULL>' if width_is_null else width_val,
-                'depth': '<NULL>' if depth_is_null else depth_val,
-                'reason': 'Width/Depth is null or blank'
-            })
-            continue
-        
-        # Skip validation for types not in our rules (e.g., Obstruction)
-        if fixture_type not in TYPE_DIMENSIONS:
-            continue
-        
-        # Get expected dimensions
-        expected = TYPE_DIMENSIONS[fixture_type]
-        expected_width = expected['Width']
-        expected_depth = expected['Depth']
-        
-        # Convert to float for comparison
-        try:
-            actual_width = float(str(width_val).strip())
-            actual_depth = float(str(depth_val).strip())
-        except (ValueError, TypeError):
-            failed_rows.append({
-                'row': idx + 2,
-                'name': str(name)[:30],
-                'type': fixture_type,
-                'width': width_val,
-                'depth': depth_val,
-                'reason': 'Cannot convert Width/Depth to number'
-            })
-            continue
-        
-        # Check if dimensions match (with small tolerance for floating point)
-        width_matches = abs(actual_width - expected_width) < 0.01
-        depth_matches = abs(actual_depth - expected_depth) < 0.01
-        
-        if not width_matches or not depth_matches:
-            failed_rows.append({
-                'row': idx + 2,
-                'name': str(name)[:30],
-                'type': fixture_type,
-                'width': actual_width,
-                'depth': actual_depth,
-                'expected_width': expected_width,
-                'expected_depth': expected_depth,
-                'reason': f"Expected Width={expected_width}, Depth={expected_depth} but got Width={actual_width}, Depth={actual_depth}"
-            })
+    # Column-wise masks instead of a per-row loop
+    types = view.type if view is not None else _strip_strings(df['Type'])
+    widths, width_ok, width_is_null = _coerce_numeric_column(df['Width'])
+    depths, depth_ok, depth_is_null = _coerce_numeric_column(df['Depth'])
+    # Masks and expected values as float/bool arrays - the expected values are
+    # looked up once per distinct Type and taken onto the rows by code
+    width_is_null = width_is_null.to_numpy()
+    depth_is_null = depth_is_null.to_numpy()
+    widths = widths.to_numpy()
+    depths = depths.to_numpy()
+    type_codes, type_values = pd.factorize(types)
+    expected_widths = EXPECTED_WIDTHS.reindex(type_values).to_numpy()[type_codes]
+    expected_depths = EXPECTED_DEPTHS.reindex(type_values).to_numpy()[type_codes]
+    
+    null_mask = width_is_null | depth_is_null
+    # Types not in our rules (e.g., Obstruction) are skipped
+    has_rule = ~np.isnan(expected_widths) & ~null_mask
+    convert_fail = has_rule & ~(width_ok.to_numpy() & depth_ok.to_numpy())
+    # Dimensions must match (with small tolerance for floating point) - both
+    # differences are within tolerance when the larger one is, so fold Depth
+    # into the Width buffer and compare once (NaN propagates: a mismatch)
+    largest_diff = _abs_diff(widths, expected_widths)
+    np.maximum(largest_diff, _abs_diff(depths, expected_depths), out=largest_diff)
+    mismatch = has_rule & ~convert_fail & ~(largest_diff < FLOAT_TOLERANCE)
+    
+    # Count every failing row, build records for the listed ones only
+    failed_mask = null_mask | convert_fail | mismatch
+    failed_positions = np.flatnonzero(failed_mask)
+    error_count = len(failed_positions)
+    
+    if error_count > 0:
+        # Gather the listed rows' values as arrays once (no per-row Series access)
+        detail = failed_positions[:MAX_DETAIL_ROWS]
+        names = df['Name'].to_numpy()[detail] if 'Name' in df.columns else ['N/A'] * len(detail)
+        failed = zip(
+            df.index[detail],
+            names,
+            types.to_numpy()[detail],
+            df['Width'].to_numpy()[detail],
+            df['Depth'].to_numpy()[detail],
+            width_is_null[detail],
+            depth_is_null[detail],
+            null_mask[detail],
+            convert_fail[detail],
+            widths[detail],
+            depths[detail],
+        )
+        for (idx, name, fixture_type, width_val, depth_val, width_null, depth_null,
+             is_null, cannot_convert, width_float, depth_float) in failed:
+            name = str(name)[:30]
+            
+            if is_null:
+                failed_rows.append({
+                    'row': idx + 2,
+                    'name': name,
+                    'type': fixture_type,
+                    'width': '<NULL>' if width_null else width_val,
+                    'depth': '<NULL>' if depth_null else depth_val,
+                    'reason': 'Width/Depth is null or blank'
+                })
+            elif cannot_convert:
+                failed_rows.append({
+                    'row': idx + 2,
+                    'name': name,
+                    'type': fixture_type,
+                    'width': width_val,
+                    'depth': depth_val,
+                    'reason': 'Cannot convert Width/Depth to number'
+                })
+            else:
+                expected = TYPE_DIMENSIONS[fixture_type]
+                expected_width = expected['Width']
+                expected_depth = expected['Depth']
+                actual_width = float(width_float)
+                actual_depth = float(depth_float)
+                failed_rows.append({
+                    'row': idx + 2,
+                    'name': name,
+                    'type': fixture_type,
+                    'width': actual_width,
+                    'depth': actual_depth,
+                    'expected_width': expected_width,
+                    'expected_depth': expected_depth,
+                    'reason': f"Expected Width={expected_width}, Depth={expected_depth} but got Width={actual_width}, Depth={actual_depth}"
+                })
     
-    error_count = len(failed_rows)
     pass_count = total_rows - error_count
     
     if error_count == 0:
@@ -291,15 +525,15 @@ def validate_type_dimensions(df: pd.DataFrame) -> ValidationResult:
     else:
         # Build detailed error message
         details_lines = [f"Total fixtures with dimension errors: {error_count}/{total_rows}"]
-        details_lines.append("\nFailed Records (showing first 10):")
+        details_lines.append(f"\nFailed Records (showing first {MAX_DETAIL_ROWS}):")
         
-        for fail in failed_rows[:10]:
+        for fail in failed_rows:
             details_lines.append(
                 f"  Row {fail['row']} ({fail['type']}): {fail['name']} - {fail['reason']}"
             )
         
-        if len(failed_rows) > 10:
-            details_lines.append(f"  ... and {len(failed_rows) - 10} more")
+        if error_count > MAX_DETAIL_ROWS:
+            details_lines.append(f"  ... and {error_count - MAX_DETAIL_ROWS} more")
         
         result = ValidationResult(
             check_name=check_name,
@@ -342,18 +576,28 @@ def validate_y_not_equal_notch(df: pd.DataFrame) -> ValidationResult:
     total_rows = len(df)
     failed_rows = []
     
-    for idx, row in df.iterrows():
-        y_val = row['Y']
-        notch_val = row['Notch']
-        name = row.get('Name', 'N/A')
-        fixture_type = row.get('Type', 'N/A')
-        
-        # Convert to string for comparison
-        y_str = str(y_val).strip()
-        notch_str = str(notch_val).strip()
-        
-        # Check if Y equals Notch
-        if y_str == notch_str and y_str != '' and y_str.lower() != 'nan':
+    # Compare stripped string forms of whole columns at once - both columns are
+    # factorized together, so each distinct value is stripped a single time
+    # and equal stripped strings share a code
+    total_values = np.concatenate([df['Y'].astype(str).to_numpy(dtype=object),
+                                   df['Notch'].astype(str).to_numpy(dtype=object)])
+    codes, uniques = pd.factorize(total_values)
+    stripped_codes, stripped_uniques = pd.factorize(np.array([value.strip() for value in uniques], dtype=object))
+    comparable = np.array([value != '' and value.lower() != 'nan' for value in stripped_uniques], dtype=bool)
+    
+    y_codes = stripped_codes[codes[:total_rows]]
+    notch_codes = stripped_codes[codes[total_rows:]]
+    equal_mask = (y_codes == notch_codes) & comparable[y_codes]
+    
+    # Count every row where Y equals Notch, build records for the listed ones only
+    error_count = int(equal_mask.sum())
+    if error_count > 0:
+        detail_mask = _detail_mask(equal_mask)
+        names = df['Name'] if 'Name' in df.columns else pd.Series('N/A', index=df.index)
+        types = df['Type'] if 'Type' in df.columns else pd.Series('N/A', index=df.index)
+        failed = zip(df.index[detail_mask], names[detail_mask], types[detail_mask],
+                     df['Y'][detail_mask], df['Notch'][detail_mask])
+        for idx, name, fixture_type, y_val, notch_val in failed:
             failed_rows.append({
                 'row': idx + 2,
                 'name': str(name)[:30],
@@ -363,7 +607,6 @@ def validate_y_not_equal_notch(df: pd.DataFrame) -> ValidationResult:
                 'reason': f'Y ({y_val}) equals Notch ({notch_val})'
             })
     
-    error_count = len(failed_rows)
     pass_count = total_rows - error_count
     
     if error_count == 0:
@@ -378,15 +621,15 @@ def validate_y_not_equal_notch(df: pd.DataFrame) -> ValidationResult:
     else:
         # Build detailed error message
         details_lines = [f"Total fixtures where Y = Notch: {error_count}/{total_rows}"]
-        details_lines.append("\nFailed Records (showing first 10):")
+        details_lines.append(f"\nFailed Records (showing first {MAX_DETAIL_ROWS}):")
         
-        for fail in failed_rows[:10]:
+        for fail in failed_rows:
             details_lines.append(
                 f"  Row {fail['row']} ({fail['type']}): {fail['name']} - {fail['reason']}"
             )
         
-        if len(failed_rows) > 10:
-            details_lines.append(f"  ... and {len(failed_rows) - 10} more")
+        if error_count > MAX_DETAIL_ROWS:
+            details_lines.append(f"  ... and {error_count - MAX_DETAIL_ROWS} more")
         
         result = ValidationResult(
             check_name=check_name,
@@ -400,13 +643,14 @@ def validate_y_not_equal_notch(df: pd.DataFrame) -> ValidationResult:
     return result
 
 
-def validate_deck_shelf_y(df: pd.DataFrame) -> ValidationResult:
+def validate_deck_shelf_y(df: pd.DataFrame, shelves: Optional[ShelfFrame] = None) -> ValidationResult:
     """Validate that DECK Shelves have Y = 5.75.
     
     Requirement: If Type = 'Shelf' AND Name starts with 'DECK', then Y must = 5.75
     
     Args:
         df: DataFrame with 'Type', 'Name', and 'Y' columns
+        shelves: Shelf rows already parsed by _shelf_numeric_frame (computed if omitted)
         
     Returns:
         ValidationResult with pass/fail status
@@ -428,52 +672,57 @@ def validate_deck_shelf_y(df: pd.DataFrame) -> ValidationResult:
     
     total_rows = len(df)
     failed_rows = []
-    deck_shelf_count = 0
     
-    for idx, row in df.iterrows():
-        fixture_type = str(row['Type']).strip()
-        name = str(row['Name']).strip()
-        y_val = row['Y']
-        
-        # Check if this is a DECK Shelf
-        is_shelf = fixture_type == 'Shelf'
-        starts_with_deck = name.upper().startswith('DECK')
-        
-        if is_shelf and starts_with_deck:
-            deck_shelf_count += 1
-            
-            # Check if Y is null/blank
-            if pd.isna(y_val) or str(y_val).strip() == '':
-                failed_rows.append({
-                    'row': idx + 2,
-                    'name': name[:30],
-                    'y': '<NULL>',
-                    'reason': 'Y is null or blank (expected 5.75)'
-                })
-                continue
-            
-            # Convert to float and check if equals 5.75
-            try:
-                y_float = float(str(y_val).strip())
-                expected_y = 5.75
-                
-                # Check with small tolerance for floating point
-                if abs(y_float - expected_y) >= 0.01:
+    # DECK Shelves: Type = 'Shelf' and Name starts with 'DECK'
+    if shelves is None:
+        shelves = _shelf_numeric_frame(df)
+    deck_mask = shelves.is_deck
+    deck_shelf_count = int(deck_mask.sum())
+    error_count = 0
+    
+    if deck_shelf_count > 0:
+        # Only the DECK Shelf subset is checked
+        y_is_null = shelves.is_blank['Y'][deck_mask]
+        y_ok = shelves.converted['Y'][deck_mask]
+        y_floats = shelves.numbers['Y'][deck_mask]
+        # Check with small tolerance for floating point
+        y_wrong = ~y_is_null & y_ok & (_abs_diff(y_floats, 5.75) >= FLOAT_TOLERANCE)
+        failed_mask = (y_is_null | ~y_ok | y_wrong).to_numpy()
+        error_count = int(failed_mask.sum())
+        
+        if error_count > 0:
+            detail_mask = _detail_mask(failed_mask)
+            failed = zip(
+                shelves.rows.index[deck_mask][detail_mask],
+                shelves.names[deck_mask][detail_mask],
+                shelves.rows['Y'][deck_mask][detail_mask],
+                y_is_null[detail_mask],
+                y_ok[detail_mask],
+                y_floats[detail_mask],
+            )
+            for idx, name, y_val, is_null, converted, y_float in failed:
+                if is_null:
+                    failed_rows.append({
+                        'row': idx + 2,
+                        'name': name[:30],
+                        'y': '<NULL>',
+                        'reason': 'Y is null or blank (expected 5.75)'
+                    })
+                elif converted:
                     failed_rows.append({
                         'row': idx + 2,
                         'name': name[:30],
                         'y': y_float,
                         'reason': f'Y = {y_float} (expected 5.75)'
                     })
-            except (ValueError, TypeError):
-                failed_rows.append({
-                    'row': idx + 2,
-                    'name': name[:30],
-                    'y': y_val,
-                    'reason': f'Cannot convert Y to number (expected 5.75)'
-                })
+                else:
+                    failed_rows.append({
+                        'row': idx + 2,
+                        'name': name[:30],
+                        'y': y_val,
+                        'reason': f'Cannot convert Y to number (expected 5.75)'
+                    })
     
-    error_count = len(failed_rows)
     pass_count = deck_shelf_count - error_count
     
     if deck_shelf_count == 0:
@@ -497,15 +746,15 @@ def validate_deck_shelf_y(df: pd.DataFrame) -> ValidationResult:
     else:
         # Build detailed error message
         details_lines = [f"Total DECK Shelves with incorrect Y: {error_count}/{deck_shelf_count}"]
-        details_lines.append("\nFailed Records (showing first 10):")
+        details_lines.append(f"\nFailed Records (showing first {MAX_DETAIL_ROWS}):")
         
-        for fail in failed_rows[:10]:
+        for fail in failed_rows:
             details_lines.append(
                 f"  Row {fail['row']}: {fail['name']} - {fail['reason']}"
             )
         
-        if len(failed_rows) > 10:
-            details_lines.append(f"  ... and {len(failed_rows) - 10} more")
+        if error_count > MAX_DETAIL_ROWS:
+            details_lines.append(f"  ... and {error_count - MAX_DETAIL_ROWS} more")
         
         result = ValidationResult(
             check_name=check_name,
@@ -519,7 +768,7 @@ def validate_deck_shelf_y(df: pd.DataFrame) -> ValidationResult:
     return result
 
 
-def validate_shelf_z(df: pd.DataFrame) -> ValidationResult:
+def validate_shelf_z(df: pd.DataFrame, shelves: Optional[ShelfFrame] = None) -> ValidationResult:
     """Validate that Shelves have correct Z values based on DECK/non-DECK.
     
     Requirements:
@@ -528,6 +777,7 @@ def validate_shelf_z(df: pd.DataFrame) -> ValidationResult:
     
     Args:
         df: DataFrame with 'Type', 'Name', and 'Z' columns
+        shelves: Shelf rows already parsed by _shelf_numeric_frame (computed if omitted)
         
     Returns:
         ValidationResult with pass/fail status
@@ -549,42 +799,46 @@ def validate_shelf_z(df: pd.DataFrame) -> ValidationResult:
     
     total_rows = len(df)
     failed_rows = []
-    shelf_count = 0
     
-    for idx, row in df.iterrows():
-        fixture_type = str(row['Type']).strip()
-        name = str(row['Name']).strip()
-        z_val = row['Z']
-        
-        # Only validate Shelves
-        if fixture_type != 'Shelf':
-            continue
-        
-        shelf_count += 1
-        
-        # Determine if DECK or non-DECK shelf
-        is_deck = name.upper().startswith('DECK')
-        expected_z = 0.25 if is_deck else 1.25
-        shelf_type = 'DECK Shelf' if is_deck else 'Non-DECK Shelf'
-        
-        # Check if Z is null/blank
-        if pd.isna(z_val) or str(z_val).strip() == '':
-            failed_rows.append({
-                'row': idx + 2,
-                'name': name[:30],
-                'shelf_type': shelf_type,
-                'z': '<NULL>',
-                'expected_z': expected_z,
-                'reason': f'Z is null or blank (expected {expected_z})'
-            })
-            continue
-        
-        # Convert to float and check
-        try:
-            z_float = float(str(z_val).strip())
+    # Only validate Shelves - DECK: Z = 0.25, Non-DECK: Z = 1.25
+    if shelves is None:
+        shelves = _shelf_numeric_frame(df)
+    shelf_count = len(shelves.rows)
+    
+    z_is_null = shelves.is_blank['Z']
+    z_ok = shelves.converted['Z']
+    z_floats = shelves.numbers['Z']
+    # Check with small tolerance for floating point
+    expected = np.where(shelves.is_deck, 0.25, 1.25)
+    z_wrong = ~z_is_null & z_ok & (_abs_diff(z_floats, expected) >= FLOAT_TOLERANCE)
+    failed_mask = (z_is_null | ~z_ok | z_wrong).to_numpy()
+    error_count = int(failed_mask.sum())
+    
+    if error_count > 0:
+        detail_mask = _detail_mask(failed_mask)
+        failed = zip(
+            shelves.rows.index[detail_mask],
+            shelves.names[detail_mask],
+            shelves.is_deck[detail_mask],
+            shelves.rows['Z'][detail_mask],
+            z_is_null[detail_mask],
+            z_ok[detail_mask],
+            z_floats[detail_mask],
+        )
+        for idx, name, is_deck, z_val, is_null, converted, z_float in failed:
+            expected_z = 0.25 if is_deck else 1.25
+            shelf_type = 'DECK Shelf' if is_deck else 'Non-DECK Shelf'
             
-            # Check with small tolerance for floating point
-            if abs(z_float - expected_z) >= 0.01:
+            if is_null:
+                failed_rows.append({
+                    'row': idx + 2,
+                    'name': name[:30],
+                    'shelf_type': shelf_type,
+                    'z': '<NULL>',
+                    'expected_z': expected_z,
+                    'reason': f'Z is null or blank (expected {expected_z})'
+                })
+            elif converted:
                 failed_rows.append({
                     'row': idx + 2,
                     'name': name[:30],
@@ -593,17 +847,16 @@ def validate_shelf_z(df: pd.DataFrame) -> ValidationResult:
                     'expected_z': expected_z,
                     'reason': f'{shelf_type}: Z = {z_float} (expected {expected_z})'
                 })
-        except (ValueError, TypeError):
-            failed_rows.append({
-                'row': idx + 2,
-                'name': name[:30],
-                'shelf_type': shelf_type,
-                'z': z_val,
-                'expected_z': expected_z,
-                'reason': f'Cannot convert Z to number (expected {expected_z})'
-            })
+            else:
+                failed_rows.append({
+                    'row': idx + 2,
+                    'name': name[:30],
+                    'shelf_type': shelf_type,
+                    'z': z_val,
+                    'expected_z': expected_z,
+                    'reason': f'Cannot convert Z to number (expected {expected_z})'
+                })
     
-    error_count = len(failed_rows)
     pass_count = shelf_count - error_count
     
     if shelf_count == 0:
@@ -627,15 +880,15 @@ def validate_shelf_z(df: pd.DataFrame) -> ValidationResult:
     else:
         # Build detailed error message
         details_lines = [f"Total Shelves with incorrect Z: {error_count}/{shelf_count}"]
-        details_lines.append("\nFailed Records (showing first 10):")
+        details_lines.append(f"\nFailed Records (showing first {MAX_DETAIL_ROWS}):")
         
-        for fail in failed_rows[:10]:
+        for fail in failed_rows:
             details_lines.append(
                 f"  Row {fail['row']}: {fail['name']} - {fail['reason']}"
             )
         
-        if len(failed_rows) > 10:
-            details_lines.append(f"  ... and {len(failed_rows) - 10} more")
+        if error_count > MAX_DETAIL_ROWS:
+            details_lines.append(f"  ... and {error_count - MAX_DETAIL_ROWS} more")
         
         result = ValidationResult(
             check_name=check_name,
@@ -649,7 +902,7 @@ def validate_shelf_z(df: pd.DataFrame) -> ValidationResult:
     return result
 
 
-def validate_shelf_overhangs(df: pd.DataFrame) -> ValidationResult:
+def validate_shelf_overhangs(df: pd.DataFrame, shelves: Optional[ShelfFrame] = None) -> ValidationResult:
     """Validate that all Shelves have Left_Overhang, Right_Overhang, Front_Overhang = 0.
     
     Requirements:
@@ -657,6 +910,7 @@ def validate_shelf_overhangs(df: pd.DataFrame) -> ValidationResult:
     
     Args:
         df: DataFrame with 'Type', 'Left_Overhang', 'Right_Overhang', 'Front_Overhang' columns
+        shelves: Shelf rows already parsed by _shelf_numeric_frame (computed if omitted)
         
     Returns:
         ValidationResult with pass/fail status
@@ -678,66 +932,43 @@ def validate_shelf_overhangs(df: pd.DataFrame) -> ValidationResult:
     
     total_rows = len(df)
     failed_rows = []
-    shelf_count = 0
     
-    for idx, row in df.iterrows():
-        fixture_type = str(row['Type']).strip()
-        name = row.get('Name', 'N/A')
-        
-        # Only validate Shelves
-        if fixture_type != 'Shelf':
-            continue
-        
-        shelf_count += 1
-        
-        left_val = row['Left_Overhang']
-        right_val = row['Right_Overhang']
-        front_val = row['Front_Overhang']
-        
-        # Check each overhang field
-        errors = []
-        
-        # Check Left_Overhang
-        if pd.isna(left_val) or str(left_val).strip() == '':
-            errors.append('Left_Overhang is null/blank')
-        else:
-            try:
-                left_float = float(str(left_val).strip())
-                if abs(left_float - 0) >= 0.01:
-                    errors.append(f'Left_Overhang={left_float}')
-            except (ValueError, TypeError):
-                errors.append('Left_Overhang is not a number')
-        
-        # Check Right_Overhang
-        if pd.isna(right_val) or str(right_val).strip() == '':
-            errors.append('Right_Overhang is null/blank')
-        else:
-            try:
-                right_float = float(str(right_val).strip())
-                if abs(right_float - 0) >= 0.01:
-                    errors.append(f'Right_Overhang={right_float}')
-            except (ValueError, TypeError):
-                errors.append('Right_Overhang is not a number')
-        
-        # Check Front_Overhang
-        if pd.isna(front_val) or str(front_val).strip() == '':
-            errors.append('Front_Overhang is null/blank')
+    # Only validate Shelves - Left/Right/Front Overhang must all be 0
+    if shelves is None:
+        shelves = _shelf_numeric_frame(df)
+    shelf_count = len(shelves.rows)
+    
+    # One error code per cell across the three columns (0 = OK, first match wins)
+    is_null = shelves.is_blank[SHELF_OVERHANG_COLUMNS].to_numpy()
+    converted = shelves.converted[SHELF_OVERHANG_COLUMNS].to_numpy()
+    floats = shelves.numbers[SHELF_OVERHANG_COLUMNS].to_numpy()
+    with np.errstate(invalid='ignore'):
+        non_zero = np.abs(floats) >= FLOAT_TOLERANCE
+    error_codes = np.select([is_null, ~converted, non_zero], [1, 2, 3], default=0)
+    failed_mask = (error_codes > 0).any(axis=1)
+    error_count = int(failed_mask.sum())
+    
+    if error_count > 0:
+        detail_mask = _detail_mask(failed_mask)
+        if 'Name' in shelves.rows.columns:
+            names = shelves.rows['Name'][detail_mask]
         else:
-            try:
-                front_float = float(str(front_val).strip())
-                if abs(front_float - 0) >= 0.01:
-                    errors.append(f'Front_Overhang={front_float}')
-            except (ValueError, TypeError):
-                errors.append('Front_Overhang is not a number')
-        
-        if errors:
+            names = pd.Series('N/A', index=shelves.rows.index[detail_mask])
+        
+        failed = zip(shelves.rows.index[detail_mask], names, error_codes[detail_mask], floats[detail_mask])
+        for idx, name, row_codes, row_floats in failed:
+            errors = [
+                OVERHANG_ERROR_FORMATS[code].format(col=col, value=float(value))
+                for col, code, value in zip(SHELF_OVERHANG_COLUMNS, row_codes, row_floats)
+                if code
+            ]
+            
             failed_rows.append({
                 'row': idx + 2,
                 'name': str(name)[:30],
                 'errors': ', '.join(errors)
             })
     
-    error_count = len(failed_rows)
     pass_count = shelf_count - error_count
     
     if shelf_count == 0:
@@ -761,15 +992,15 @@ def validate_shelf_overhangs(df: pd.DataFrame) -> ValidationResult:
     else:
         # Build detailed error message
         details_lines = [f"Total Shelves with non-zero overhangs: {error_count}/{shelf_count}"]
-        details_lines.append("\nFailed Records (showing first 10):")
+        details_lines.append(f"\nFailed Records (showing first {MAX_DETAIL_ROWS}):")
         
-        for fail in failed_rows[:10]:
+        for fail in failed_rows:
             details_lines.append(
                 f"  Row {fail['row']}: {fail['name']} - {fail['errors']}"
             )
         
-        if len(failed_rows) > 10:
-            details_lines.append(f"  ... and {len(failed_rows) - 10} more")
+        if error_count > MAX_DETAIL_ROWS:
+            details_lines.append(f"  ... and {error_count - MAX_DETAIL_ROWS} more")
         
         result = ValidationResult(
             check_name=check_name,
@@ -783,7 +1014,7 @@ def validate_shelf_overhangs(df: pd.DataFrame) -> ValidationResult:
     return result
 
 
-def validate_shelf_back_overhang(df: pd.DataFrame) -> ValidationResult:
+def validate_shelf_back_overhang(df: pd.DataFrame, shelves: Optional[ShelfFrame] = None) -> ValidationResult:
     """Validate that Shelves have correct Back_Overhang values based on DECK/non-DECK.
     
     Requirements:
@@ -792,6 +1023,7 @@ def validate_shelf_back_overhang(df: pd.DataFrame) -> ValidationResult:
     
     Args:
         df: DataFrame with 'Type', 'Name', and 'Back_Overhang' columns
+        shelves: Shelf rows already parsed by _shelf_numeric_frame (computed if omitted)
         
     Returns:
         ValidationResult with pass/fail status
@@ -813,42 +1045,49 @@ def validate_shelf_back_overhang(df: pd.DataFrame) -> ValidationResult:
     
     total_rows = len(df)
     failed_rows = []
-    shelf_count = 0
     
-    for idx, row in df.iterrows():
-        fixture_type = str(row['Type']).strip()
-        name = str(row['Name']).strip()
-        back_overhang_val = row['Back_Overhang']
-        
-        # Only validate Shelves
-        if fixture_type != 'Shelf':
-            continue
-        
-        shelf_count += 1
-        
-        # Determine if DECK or non-DECK shelf
-        is_deck = name.upper().startswith('DECK')
-        expected_back = 0 if is_deck else 1.25
-        shelf_type = 'DECK Shelf' if is_deck else 'Non-DECK Shelf'
-        
-        # Check if Back_Overhang is null/blank
-        if pd.isna(back_overhang_val) or str(back_overhang_val).strip() == '':
-            failed_rows.append({
-                'row': idx + 2,
-                'name': name[:30],
-                'shelf_type': shelf_type,
-                'back_overhang': '<NULL>',
-                'expected_back': expected_back,
-                'reason': f'Back_Overhang is null or blank (expected {expected_back})'
-            })
-            continue
-        
-        # Convert to float and check
-        try:
-            back_float = float(str(back_overhang_val).strip())
+    # Only validate Shelves - DECK: Back_Overhang = 0, Non-DECK: Back_Overhang = 1.25
+    if shelves is None:
+        shelves = _shelf_numeric_frame(df)
+    shelf_count = len(shelves.rows)
+    
+    back_is_null = shelves.is_blank['Back_Overhang'].to_numpy()
+    back_ok = shelves.converted['Back_Overhang'].to_numpy()
+    back_floats = shelves.numbers['Back_Overhang']
+    # Check with small tolerance for floating point - null and unconverted
+    # values fail anyway, so the masks are folded into one NumPy buffer
+    # without first excluding them from the comparison
+    expected = np.where(shelves.is_deck, 0.0, 1.25)
+    failed_mask = _abs_diff(back_floats, expected) >= FLOAT_TOLERANCE
+    failed_mask |= back_is_null
+    failed_mask |= ~back_ok
+    error_count = int(failed_mask.sum())
+    
+    if error_count > 0:
+        detail_mask = _detail_mask(failed_mask)
+        failed = zip(
+            shelves.rows.index[detail_mask],
+            shelves.names[detail_mask],
+            shelves.is_deck[detail_mask],
+            shelves.rows['Back_Overhang'][detail_mask],
+            back_is_null[detail_mask],
+            back_ok[detail_mask],
+            back_floats[detail_mask],
+        )
+        for idx, name, is_deck, back_overhang_val, is_null, converted, back_float in failed:
+            expected_back = 0 if is_deck else 1.25
+            shelf_type = 'DECK Shelf' if is_deck else 'Non-DECK Shelf'
             
-            # Check with small tolerance for floating point
-            if abs(back_float - expected_back) >= 0.01:
+            if is_null:
+                failed_rows.append({
+                    'row': idx + 2,
+                    'name': name[:30],
+                    'shelf_type': shelf_type,
+                    'back_overhang': '<NULL>',
+                    'expected_back': expected_back,
+                    'reason': f'Back_Overhang is null or blank (expected {expected_back})'
+                })
+            elif converted:
                 failed_rows.append({
                     'row': idx + 2,
                     'name': name[:30],
@@ -857,17 +1096,16 @@ def validate_shelf_back_overhang(df: pd.DataFrame) -> ValidationResult:
                     'expected_back': expected_back,
                     'reason': f'{shelf_type}: Back_Overhang = {back_float} (expected {expected_back})'
                 })
-        except (ValueError, TypeError):
-            failed_rows.append({
-                'row': idx + 2,
-                'name': name[:30],
-                'shelf_type': shelf_type,
-                'back_overhang': back_overhang_val,
-                'expected_back': expected_back,
-                'reason': f'Cannot convert Back_Overhang to number (expected {expected_back})'
-            })
+            else:
+                failed_rows.append({
+                    'row': idx + 2,
+                    'name': name[:30],
+                    'shelf_type': shelf_type,
+                    'back_overhang': back_overhang_val,
+                    'expected_back': expected_back,
+                    'reason': f'Cannot convert Back_Overhang to number (expected {expected_back})'
+                })
     
-    error_count = len(failed_rows)
     pass_count = shelf_count - error_count
     
     if shelf_count == 0:
@@ -891,15 +1129,15 @@ def validate_shelf_back_overhang(df: pd.DataFrame) -> ValidationResult:
     else:
         # Build detailed error message
         details_lines = [f"Total Shelves with incorrect Back_Overhang: {error_count}/{shelf_count}"]
-        details_lines.append("\nFailed Records (showing first 10):")
+        details_lines.append(f"\nFailed Records (showing first {MAX_DETAIL_ROWS}):")
         
-        for fail in failed_rows[:10]:
+        for fail in failed_rows:
             details_lines.append(
                 f"  Row {fail['row']}: {fail['name']} - {fail['reason']}"
             )
         
-        if len(failed_rows) > 10:
-            details_lines.append(f"  ... and {len(failed_rows) - 10} more")
+        if error_count > MAX_DETAIL_ROWS:
+            details_lines.append(f"  ... and {error_count - MAX_DETAIL_ROWS} more")
         
         result = ValidationResult(
             check_name=check_name,
@@ -913,68 +1151,78 @@ def validate_shelf_back_overhang(df: pd.DataFrame) -> ValidationResult:
     return result
 
 
-def validate_fixture_data(fixture_rows: List[List[str]], df: pd.DataFrame = None) -> tuple[List[ValidationResult], dict]:
+def validate_fixture_data(fixture_rows: List[List[str]], df: pd.DataFrame = None,
+                          max_cols: Optional[int] = None) -> tuple[List[ValidationResult], dict]:
     """Run all fixture validations.
     
     Args:
         fixture_rows: List of Fixture rows from PSA
         df: Optional DataFrame with mapped/cleaned data for field-level checks
+        max_cols: Field count of the widest row, if already known
         
     Returns:
         Tuple of (validation_results, summary_dict)
     """
-    print("[FIXTURE VALIDATOR] Starting validation checks...")
+    logger.debug("Starting validation checks...")
     
     validation_results = []
     
     # Validation 1: Field Count
-    field_count_result = validate_field_count(fixture_rows)
+    field_count_result = validate_field_count(fixture_rows, max_cols=max_cols)
     validation_results.append(field_count_result)
-    print(f"[FIXTURE VALIDATOR] Field_Count: {field_count_result.status}")
+    logger.debug("Field_Count: %s", field_count_result.status)
     
-    # Validation 2: Unique Names (if DataFrame provided)
-    if df is not None:
+    # Validation 2: Unique Names (if DataFrame provided and its rows have the
+    # expected layout - field-level checks are meaningless otherwise)
+    if df is not None and field_count_result.passed:
+        # Type/Name are normalized once and shared by the validators below
+        view = prepare_validation_view(df)
+        
         unique_name_result = validate_unique_names(df)
         validation_results.append(unique_name_result)
-        print(f"[FIXTURE VALIDATOR] Unique_Name: {unique_name_result.status}")
+        logger.debug("Unique_Name: %s", unique_name_result.status)
         
         # Validation 3: Type Dimensions
-        type_dimensions_result = validate_type_dimensions(df)
+        type_dimensions_result = validate_type_dimensions(df, view=view)
         validation_results.append(type_dimensions_result)
-        print(f"[FIXTURE VALIDATOR] Type_Dimensions: {type_dimensions_result.status}")
+        logger.debug("Type_Dimensions: %s", type_dimensions_result.status)
         
         # Validation 4: Y Not Equal Notch
         y_notch_result = validate_y_not_equal_notch(df)
         validation_results.append(y_notch_result)
-        print(f"[FIXTURE VALIDATOR] Y_Not_Equal_Notch: {y_notch_result.status}")
+        logger.debug("Y_Not_Equal_Notch: %s", y_notch_result.status)
+        
+        # Validations 5-8 share one parse of the Shelf rows
+        shelves = _shelf_numeric_frame(df, view=view) if view.type is not None else None
         
         # Validation 5: DECK Shelf Y Check
-        deck_shelf_y_result = validate_deck_shelf_y(df)
+        deck_shelf_y_result = validate_deck_shelf_y(df, shelves=shelves)
         validation_results.append(deck_shelf_y_result)
-        print(f"[FIXTURE VALIDATOR] Deck_Shelf_Y: {deck_shelf_y_result.status}")
+        logger.debug("Deck_Shelf_Y: %s", deck_shelf_y_result.status)
         
         # Validation 6: Shelf Z Check
-        shelf_z_result = validate_shelf_z(df)
+        shelf_z_result = validate_shelf_z(df, shelves=shelves)
         validation_results.append(shelf_z_result)
-        print(f"[FIXTURE VALIDATOR] Shelf_Z: {shelf_z_result.status}")
+        logger.debug("Shelf_Z: %s", shelf_z_result.status)
         
         # Validation 7: Shelf Overhangs Check
-        shelf_overhangs_result = validate_shelf_overhangs(df)
+        shelf_overhangs_result = validate_shelf_overhangs(df, shelves=shelves)
         validation_results.append(shelf_overhangs_result)
-        print(f"[FIXTURE VALIDATOR] Shelf_Overhangs: {shelf_overhangs_result.status}")
+        logger.debug("Shelf_Overhangs: %s", shelf_overhangs_result.status)
         
         # Validation 8: Shelf Back_Overhang Check
-        shelf_back_overhang_result = validate_shelf_back_overhang(df)
+        shelf_back_overhang_result = validate_shelf_back_overhang(df, shelves=shelves)
         validation_results.append(shelf_back_overhang_result)
-        print(f"[FIXTURE VALIDATOR] Shelf_Back_Overhang: {shelf_back_overhang_result.status}")
+        logger.debug("Shelf_Back_Overhang: %s", shelf_back_overhang_result.status)
     
     # TODO: Add more validations here as we build them
     
     # Calculate summary
     total_checks = len(validation_results)
-    passed = sum(1 for r in validation_results if r.passed)
-    failed = sum(1 for r in validation_results if not r.passed and r.status == 'FAIL')
-    warnings = sum(1 for r in validation_results if r.status == 'WARNING')
+    status_counts = Counter(r.status for r in validation_results)
+    passed = status_counts['PASS']
+    failed = status_counts['FAIL']
+    warnings = status_counts['WARNING']
     
     summary = {
         'total_checks': total_checks,
@@ -984,6 +1232,6 @@ def validate_fixture_data(fixture_rows: List[List[str]], df: pd.DataFrame = None
         'overall_status': 'PASS' if failed == 0 else 'FAIL'
     }
     
-    print(f"[FIXTURE VALIDATOR] Validation complete: {passed} passed, {failed} failed, {warnings} warnings")
+    logger.debug("Validation complete: %s passed, %s failed, %s warnings", passed, failed, warnings)
     
     return validation_results, summary
@@ -1,13 +1,22 @@
 """Extract and validate Planogram data from PSA files."""
 from __future__ import annotations
 
+import logging
+from datetime import date
 from typing import Tuple, List, Optional
 import pandas as pd
 
+from app.services.extraction_cache import cached_extraction
 from app.services.planogram_psa_reader import read_planogram_rows_from_bytes
-from app.services.planogram_mapper import smart_map_planogram_fields, FIELD_NAMES
+from app.services.planogram_mapper import smart_map_planogram_values, FIELD_NAMES_ORDERED
 from app.services.planogram_validator import DataValidator, ValidationResult
 
+logger = logging.getLogger(__name__)
+
+# Columns holding a handful of distinct values across all rows - stored as
+# categories, so the validators work on the categories instead of every row
+CATEGORICAL_COLUMNS = ['Table_Name', 'Department', 'Category']
+
 
 def extract_planogram_data(
     psa_bytes: bytes,
@@ -15,6 +24,11 @@ def extract_planogram_data(
 ) -> Tuple[pd.DataFrame, List[ValidationResult], dict]:
     """Extract Planogram data and run validation checks.
     
+    Results are cached per input content (see extraction_cache); each call
+    gets its own copy of the DataFrame, results list and summary. The
+    Effective_Date mapping compares against today's date, so the date is part
+    of the cache key - a cached result never outlives the day it was built on.
+    
     Args:
         psa_bytes: Raw PSA file bytes
         excel_reference_bytes: Optional Excel reference file bytes for department validation
@@ -26,38 +40,61 @@ def extract_planogram_data(
         - Summary dict (passed, failed, warnings counts)
     """
     
-    print("[PLANOGRAM] Starting extraction...")
+    today = date.today()
+    return cached_extraction(
+        'planogram',
+        lambda: _extract_planogram_data(psa_bytes, excel_reference_bytes, today),
+        psa_bytes,
+        excel_reference_bytes=excel_reference_bytes,
+        key_extra=(today,)
+    )
+
+
+def _extract_planogram_data(
+    psa_bytes: bytes,
+    excel_reference_bytes: Optional[bytes],
+    today: date
+) -> Tuple[pd.DataFrame, List[ValidationResult], dict]:
+    """Run the uncached Planogram read, smart-map and validation pipeline.
+    
+    Args:
+        psa_bytes: Raw PSA file bytes
+        excel_reference_bytes: Optional Excel reference file bytes for department validation
+        today: Today's date (for the Effective_Date mapping)
+        
+    Returns:
+        Tuple of (DataFrame, validation_results, summary)
+    """
+    logger.debug("Starting extraction...")
     
     # Step 1: Extract Planogram rows
     planogram_rows = read_planogram_rows_from_bytes(psa_bytes)
     if not planogram_rows:
         raise ValueError("No Planogram rows found in PSA file")
     
-    print(f"[PLANOGRAM] Extracted {len(planogram_rows)} records")
-    
-    # Step 2: Apply smart mapping to each row
-    mapped_data = []
-    for row in planogram_rows:
-        mapped_row = smart_map_planogram_fields(row)
-        mapped_data.append(mapped_row)
+    logger.debug("Extracted %s records", len(planogram_rows))
     
-    print(f"[PLANOGRAM] Smart-mapped {len(mapped_data)} rows with 22 fields each")
+    # Step 2: Apply smart mapping to each row (rows repeated within or across
+    # files come from the mapper's cache)
+    mapped_data = [smart_map_planogram_values(tuple(row), today) for row in planogram_rows]
     
-    # Step 3: Create DataFrame with renamed columns
-    df = pd.DataFrame(mapped_data)
+    logger.debug("Smart-mapped %s rows with 22 fields each", len(mapped_data))
     
-    # Ensure columns are in the correct order (0-21)
-    ordered_columns = [FIELD_NAMES[i] for i in range(22)]
-    df = df[ordered_columns]
+    # Step 3: Create DataFrame with renamed columns, built directly in the
+    # correct order (0-21) - no reorder copy afterwards
+    df = pd.DataFrame(mapped_data, columns=list(FIELD_NAMES_ORDERED))
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype('category')
     
-    print(f"[PLANOGRAM] Created DataFrame with columns: {', '.join(df.columns.tolist())}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Created DataFrame with columns: %s", ', '.join(df.columns.tolist()))
     
     # Step 4: Run validation checks
-    print(f"[PLANOGRAM] Running validation checks...")
+    logger.debug("Running validation checks...")
     validator = DataValidator(df, excel_reference_bytes=excel_reference_bytes)
     validation_results = validator.run_all_checks()
     summary = validator.get_summary()
     
-    print(f"[PLANOGRAM] Validation complete: {summary['passed']} passed, {summary['failed']} failed")
+    logger.debug("Validation complete: %s passed, %s failed", summary['passed'], summary['failed'])
     
     return df, validation_results, summary
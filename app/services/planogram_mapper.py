@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 
 # Field name mapping (22 fields)
 FIELD_NAMES = {
@@ -30,10 +31,143 @@ FIELD_NAMES = {
     21: 'Trait_Number'
 }
 
+# Field names in index order (0-21)
+FIELD_NAMES_ORDERED = tuple(FIELD_NAMES[i] for i in range(len(FIELD_NAMES)))
+
+# Substring probes (index, substring, case-insensitive): each index takes the
+# first search-pool field containing its substring
+SUBSTRING_PROBES = [
+    (7, '7.81', False),
+    (8, '1.25', False),
+    (12, 'general_tc', True),
+    (13, 'product listing.pst', True),
+    (14, 'shelf', True),
+    (15, 'nr_p_c_seg.psy', True),
+    (16, '.psa', True)
+]
+
+# Formats tried (in order) when parsing an Index 11 date candidate
+DATE_FORMATS = ['%m/%d/%Y', '%m/%d/%y']
+
+# Index 9 values, and the patterns used by the searches/calculations below
+INDEX_9_TARGETS = frozenset(['14', '17', '20', '22', '71', '74'])
+_FOUR_DIGIT_PATTERN = re.compile(r'\d{4}')
+_DATE_PATTERN = re.compile(r'\d{1,2}/\d{1,2}/\d{2,4}')
+_NON_DIGIT_PATTERN = re.compile(r'\D+')
+_LEADING_DIGITS_PATTERN = re.compile(r'\d+')
+
+
+def _find_substring_probes(search_pool: list[str], joined: str) -> dict[int, str]:
+    """Find every substring probe in the search pool with C-level searches.
+    
+    The pool is searched as one newline-joined haystack (plus one lower-cased
+    copy, made once) so each probe is a single str.find instead of a Python
+    loop over the fields. Fields come from single PSA lines and never contain
+    a newline, so the number of newlines before a match is the matching
+    field's position.
+    
+    Args:
+        search_pool: Fields to search (index 7 onwards)
+        joined: The search pool joined on newlines
+        
+    Returns:
+        Dictionary of index -> stripped value of the first matching field
+        (indices without a match are missing)
+    """
+    found = {}
+    if not search_pool:
+        return found
+    
+    # Lower-casing may change a field's length but never adds or removes a
+    # newline, so both haystacks map matches to fields the same way
+    haystacks = {False: joined, True: joined.lower()}
+    
+    for index, substring, ignore_case in SUBSTRING_PROBES:
+        haystack = haystacks[ignore_case]
+        pos = haystack.find(substring)
+        while pos != -1:
+            field = search_pool[haystack.count('\n', 0, pos)]
+            if index != 14 or len(field.strip()) < 20:  # Avoid long text matches
+                found[index] = field.strip()
+                break
+            # Keep searching from the next field
+            field_end = haystack.find('\n', pos)
+            pos = haystack.find(substring, field_end + 1) if field_end != -1 else -1
+    
+    return found
+
+
+@lru_cache(maxsize=1024)
+def _is_future_monday(date_str: str, today: date) -> bool:
+    """Check whether a date string parses to a Monday after today.
+    
+    Rows of one file repeat the same few dates, so results are cached per
+    (date string, today) and each distinct date is parsed only once a day.
+    
+    Args:
+        date_str: Date candidate (M/D/Y)
+        today: Today's date
+        
+    Returns:
+        True if the first format that parses gives a Monday after today
+    """
+    for fmt in DATE_FORMATS:
+        try:
+            parsed_date = datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+        # Successfully parsed - only this format counts
+        return parsed_date.date() > today and parsed_date.weekday() == 0
+    return False
+
+
+def _find_effective_date(joined: str, today: date) -> str:
+    """Find the first field whose first date is a Monday after today.
+    
+    The date pattern runs once over the newline-joined pool instead of once
+    per field. Dates never span a newline, so the newline count before a
+    match is its field, and only the first match in each field is checked
+    (as a per-field search would).
+    
+    Args:
+        joined: The search pool (index 7 onwards) joined on newlines
+        today: Today's date
+        
+    Returns:
+        The matching date string, '' if there is none
+    """
+    last_field = -1
+    for match in _DATE_PATTERN.finditer(joined):
+        field = joined.count('\n', 0, match.start())
+        if field == last_field:
+            continue
+        last_field = field
+        if _is_future_monday(match.group(), today):
+            return match.group()
+    return ''
+
 
 def smart_map_planogram_fields(fields: list[str]) -> dict[str, str]:
     """
-    Apply smart mapping to Planogram fields.
+    Apply smart mapping to Planogram fields (see smart_map_planogram_values).
+    
+    Args:
+        fields: Raw field list from Planogram row
+        
+    Returns:
+        Dictionary mapping field names to values
+    """
+    return dict(zip(FIELD_NAMES_ORDERED, smart_map_planogram_values(tuple(fields), date.today())))
+
+
+@lru_cache(maxsize=8192)
+def smart_map_planogram_values(fields: tuple[str, ...], today: date) -> tuple[str, ...]:
+    """
+    Apply smart mapping to Planogram fields, as values in FIELD_NAMES_ORDERED order.
+    
+    Rows of a planogram repeat the same metadata, so results are cached per
+    (fields, today) - the Effective_Date depends on today's date - and are
+    returned as immutable tuples that callers can share safely.
     
     Strategy:
         - Indices 0-6: Fixed (as-is from PSA)
@@ -54,132 +188,81 @@ def smart_map_planogram_fields(fields: list[str]) -> dict[str, str]:
         - Index 21: Numbers between _ and first alphabet in Index 16
     
     Args:
-        fields: Raw field list from Planogram row
+        fields: Raw fields of a Planogram row
+        today: Today's date (for the Effective_Date search)
         
     Returns:
-        Dictionary mapping field names to values
+        Tuple of the 22 mapped values
     """
     
-    # Start with first 7 fields as-is (indices 0-6)
-    mapped = fields[:7] if len(fields) >= 7 else fields + [''] * (7 - len(fields))
+    # One slot per output field, filled by index; the first 7 fields are
+    # taken as-is (indices 0-6, missing ones stay '')
+    mapped = [''] * len(FIELD_NAMES_ORDERED)
+    mapped[:min(len(fields), 7)] = fields[:7]
     
     # Search in remaining fields (from index 7 onwards)
-    search_pool = fields[7:] if len(fields) > 7 else []
+    search_pool = fields[7:]
+    # Joined once and shared by the substring and date searches
+    joined = '\n'.join(search_pool)
+    
+    # Indices 7-8 and 12-16: substring searches, all done in one pass
+    probe_values = _find_substring_probes(search_pool, joined)
     
     # Index 7: Search for '7.81'
-    idx_7_value = ''
-    for field in search_pool:
-        if '7.81' in field:
-            idx_7_value = field.strip()
-            break
-    mapped.append(idx_7_value)
+    mapped[7] = probe_values.get(7, '')
     
     # Index 8: Search for '1.25'
-    idx_8_value = ''
-    for field in search_pool:
-        if '1.25' in field:
-            idx_8_value = field.strip()
-            break
-    mapped.append(idx_8_value)
+    mapped[8] = probe_values.get(8, '')
     
     # Index 9 & 10: Search for any of [14, 17, 20, 22, 71, 74]
     # Index 10: Find the closest 4-digit number after Index 9
-    target_values = ['14', '17', '20', '22', '71', '74']
     idx_9_value = ''
     idx_10_value = ''
     
     for i, field in enumerate(search_pool):
-        if field.strip() in target_values:
+        if field.strip() in INDEX_9_TARGETS:
             idx_9_value = field
             # Search for the closest 4-digit number after Index 9
             for j in range(i + 1, len(search_pool)):
                 candidate = search_pool[j].strip()
                 # Check if it's a 4-digit number (with or without leading zeros)
-                if re.match(r'^\d{4}$', candidate):
+                if _FOUR_DIGIT_PATTERN.fullmatch(candidate):
                     idx_10_value = candidate
                     break
             break
     
-    mapped.append(idx_9_value)
-    mapped.append(idx_10_value)
+    mapped[9] = idx_9_value
+    mapped[10] = idx_10_value
     
     # Index 11: Date pattern (mo/day/year) - only if after today AND on a Monday
-    date_pattern = re.compile(r'\d{1,2}/\d{1,2}/\d{2,4}')
-    idx_11_value = ''
-    today = datetime.now()
-    
-    for field in search_pool:
-        match = date_pattern.search(field.strip())
-        if match:
-            date_str = match.group()  # Extract ONLY the date, not the whole field
-            try:
-                # Parse the date (try different year formats)
-                for fmt in ['%m/%d/%Y', '%m/%d/%y']:
-                    try:
-                        parsed_date = datetime.strptime(date_str, fmt)
-                        # Check if date is after today AND is a Monday (weekday 0)
-                        if parsed_date > today and parsed_date.weekday() == 0:
-                            idx_11_value = date_str
-                            break
-                        break  # Successfully parsed, exit format loop
-                    except ValueError:
-                        continue
-                if idx_11_value:  # Found valid date
-                    break
-            except (ValueError, AttributeError):
-                continue
-    
-    mapped.append(idx_11_value)
+    # (extracts ONLY the date, not the whole field)
+    idx_11_value = _find_effective_date(joined, today)
+    mapped[11] = idx_11_value
     
     # Index 12: Search for "GENERAL_TC" (case-insensitive)
-    idx_12_value = ''
-    for field in search_pool:
-        if 'general_tc' in field.lower():
-            idx_12_value = field.strip()
-            break
-    mapped.append(idx_12_value)
+    mapped[12] = probe_values.get(12, '')
     
     # Index 13: Search for "PRODUCT LISTING.PST" (case-insensitive)
-    idx_13_value = ''
-    for field in search_pool:
-        if 'product listing.pst' in field.lower():
-            idx_13_value = field.strip()
-            break
-    mapped.append(idx_13_value)
+    mapped[13] = probe_values.get(13, '')
     
-    # Index 14: Search for "SHELF" (case-insensitive)
-    idx_14_value = ''
-    for field in search_pool:
-        if 'shelf' in field.lower() and len(field.strip()) < 20:  # Avoid long text matches
-            idx_14_value = field.strip()
-            break
-    mapped.append(idx_14_value)
+    # Index 14: Search for "SHELF" (case-insensitive, short fields only)
+    mapped[14] = probe_values.get(14, '')
     
     # Index 15: Search for "NR_P_C_SEG.PSY" (case-insensitive)
-    idx_15_value = ''
-    for field in search_pool:
-        if 'nr_p_c_seg.psy' in field.lower():
-            idx_15_value = field.strip()
-            break
-    mapped.append(idx_15_value)
+    mapped[15] = probe_values.get(15, '')
     
     # Index 16: Search for any field containing ".psa" (case-insensitive)
-    idx_16_value = ''
-    for field in search_pool:
-        if '.psa' in field.lower():
-            idx_16_value = field.strip()
-            break
-    mapped.append(idx_16_value)
+    mapped[16] = probe_values.get(16, '')
     
     # Index 17: Field_3 value divided by 12 (calculated field)
     idx_17_value = ''
     try:
-        field_3_value = mapped[3] if len(mapped) > 3 else ''
+        field_3_value = mapped[3]
         field_3_numeric = float(field_3_value) if field_3_value else 0
         idx_17_value = str(field_3_numeric / 12) if field_3_numeric != 0 else ''
     except (ValueError, IndexError):
         idx_17_value = ''
-    mapped.append(idx_17_value)
+    mapped[17] = idx_17_value
     
     # Index 18: Index 17 value divided by 4 (calculated field)
     idx_18_value = ''
@@ -188,49 +271,43 @@ def smart_map_planogram_fields(fields: list[str]) -> dict[str, str]:
         idx_18_value = str(idx_17_numeric / 4) if idx_17_numeric != 0 else ''
     except (ValueError, IndexError):
         idx_18_value = ''
-    mapped.append(idx_18_value)
+    mapped[18] = idx_18_value
     
     # Index 19: First 5 digits from Index 16 (extract from .psa field)
     idx_19_value = ''
     try:
-        idx_16_text = mapped[16] if len(mapped) > 16 else ''
+        idx_16_text = mapped[16]
         # Extract all digits from Index 16
-        digits_only = ''.join(re.findall(r'\d', idx_16_text))
+        digits_only = _NON_DIGIT_PATTERN.sub('', idx_16_text)
         # Take first 5 digits
         idx_19_value = digits_only[:5] if len(digits_only) >= 5 else digits_only
     except (IndexError, AttributeError):
         idx_19_value = ''
-    mapped.append(idx_19_value)
+    mapped[19] = idx_19_value
     
     # Index 20: Characters 6, 7, 8 from Index 16 (positions 5, 6, 7 in 0-based indexing)
     idx_20_value = ''
     try:
-        idx_16_text = mapped[16] if len(mapped) > 16 else ''
+        idx_16_text = mapped[16]
         # Extract characters at positions 5, 6, 7 (6th, 7th, 8th characters)
         idx_20_value = idx_16_text[5:8] if len(idx_16_text) >= 8 else ''
     except (IndexError, AttributeError):
         idx_20_value = ''
-    mapped.append(idx_20_value)
+    mapped[20] = idx_20_value
     
     # Index 21: Numbers between underscore (_) and first alphabet from Index 16
     idx_21_value = ''
     try:
-        idx_16_text = mapped[16] if len(mapped) > 16 else ''
+        idx_16_text = mapped[16]
         # Find underscore position
         if '_' in idx_16_text:
             after_underscore = idx_16_text.split('_', 1)[1]  # Get everything after first _
             # Extract digits until we hit a letter
-            match = re.match(r'^(\d+)', after_underscore)
+            match = _LEADING_DIGITS_PATTERN.match(after_underscore)
             if match:
-                idx_21_value = match.group(1)
+                idx_21_value = match.group()
     except (IndexError, AttributeError):
         idx_21_value = ''
-    mapped.append(idx_21_value)
-    
-    # Convert to dictionary with field names
-    result = {}
-    for i, value in enumerate(mapped):
-        field_name = FIELD_NAMES.get(i, f'Field_{i}')
-        result[field_name] = value
+    mapped[21] = idx_21_value
     
-    return result
+    return tuple(mapped)
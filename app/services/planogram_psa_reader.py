@@ -1,23 +1,51 @@
 """PSA file reader for extracting Planogram rows."""
 from __future__ import annotations
 
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# "Planogram," up to the end of its line - lines end at the same separators
+# str.splitlines() breaks on: the ASCII ones and the UTF-8 encodings of
+# U+0085/U+2028/U+2029
+_PLANOGRAM_LINE_PATTERN = re.compile(
+    rb'Planogram,(?:[^\n\r\x0b\x0c\x1c\x1d\x1e\xc2\xe2]|\xc2(?!\x85)|\xe2(?!\x80[\xa8\xa9]))*'
+)
+
+# Line separators a match must directly follow to start a line
+_LINE_SEPARATOR_BYTES = frozenset(b'\n\r\x0b\x0c\x1c\x1d\x1e')
+_LINE_SEPARATOR_SEQUENCES = (b'\xc2\x85', b'\xe2\x80\xa8', b'\xe2\x80\xa9')
+
+
+def _starts_line(psa_bytes: bytes, pos: int) -> bool:
+    """Check whether pos is at the start of the file or right after a line separator."""
+    if pos == 0 or psa_bytes[pos - 1] in _LINE_SEPARATOR_BYTES:
+        return True
+    return any(psa_bytes[pos - len(sep):pos] == sep for sep in _LINE_SEPARATOR_SEQUENCES)
+
 
 def parse_csv_line(line: str) -> list[str]:
-    """Parse a CSV line respecting quoted fields with commas."""
-    fields = []
-    current = ""
-    in_quotes = False
+    """Parse a CSV line respecting quoted fields with commas.
+    
+    Every double quote toggles quoting and is dropped; commas only split
+    outside quotes. Splitting on the quotes first puts the quoted segments at
+    odd positions, so the work is done by str.split instead of a loop per
+    character.
+    """
+    if '"' not in line:
+        return line.split(',')
     
-    for char in line:
-        if char == '"':
-            in_quotes = not in_quotes
-        elif char == ',' and not in_quotes:
-            fields.append(current)
-            current = ""
+    fields = ['']
+    for i, segment in enumerate(line.split('"')):
+        if i % 2:
+            # Inside quotes - commas are part of the field
+            fields[-1] += segment
         else:
-            current += char
+            parts = segment.split(',')
+            fields[-1] += parts[0]
+            fields.extend(parts[1:])
     
-    fields.append(current)  # Add last field
     return fields
 
 
@@ -30,35 +58,37 @@ def merge_long_text_fields(fields: list[str]) -> list[str]:
     if not fields:
         return fields
     
+    # Length and first non-blank character of each field, computed once
+    # ('<?xml' starts with '<', so '{' and '<' cover every marker)
+    lengths = [len(field) for field in fields]
+    starts_block = [field.lstrip()[:1] in ('{', '<') for field in fields]
+    
+    # Most rows have no long text at all
+    if max(lengths) <= 100 and not any(starts_block):
+        return fields
+    
     merged = []
     i = 0
     
     while i < len(fields):
-        field = fields[i]
-        
         # Check if this is a long-text field
-        is_long_text = (
-            len(field) > 100 or 
-            field.strip().startswith(('{', '<', '<?xml'))
-        )
+        is_long_text = lengths[i] > 100 or starts_block[i]
         
         if is_long_text:
-            # Merge with next fields if they're also long or part of the same block
-            merged_field = field
+            # Merge with next fields if they're also long or part of the same
+            # block - collected and joined once, not concatenated repeatedly
             j = i + 1
             
             while j < len(fields):
-                next_field = fields[j]
                 # Stop if we hit a "normal" field
-                if len(next_field) < 50 and not next_field.strip().startswith(('{', '<')):
+                if lengths[j] < 50 and not starts_block[j]:
                     break
-                merged_field += " " + next_field
                 j += 1
             
-            merged.append(merged_field)
+            merged.append(' '.join(fields[i:j]))
             i = j
         else:
-            merged.append(field)
+            merged.append(fields[i])
             i += 1
     
     return merged
@@ -68,31 +98,31 @@ def read_planogram_rows_from_bytes(psa_bytes: bytes) -> list[list[str]]:
     """Extract all Planogram rows from PSA file bytes.
     
     Args:
-        psa_bytes: Raw bytes from uploaded .psa file
+        psa_bytes: Raw bytes from uploaded .psa file (bytes or any buffer, e.g. an mmap)
         
     Returns:
         List of Planogram rows (each row is a list of field values)
     """
     try:
-        # Decode bytes to text
-        content = psa_bytes.decode('utf-8', errors='ignore')
-        lines = content.splitlines()
-        
         planogram_rows = []
         
-        for line in lines:
-            if line.startswith('Planogram,'):
-                # Parse the CSV line
-                fields = parse_csv_line(line)
-                
-                # Merge long-text fields to reduce noise
-                merged_fields = merge_long_text_fields(fields)
-                
-                planogram_rows.append(merged_fields)
+        # Scan the raw bytes - only the Planogram lines are ever decoded
+        for match in _PLANOGRAM_LINE_PATTERN.finditer(psa_bytes):
+            if not _starts_line(psa_bytes, match.start()):
+                continue
+            line = match.group().decode('utf-8', errors='ignore')
+            
+            # Parse the CSV line
+            fields = parse_csv_line(line)
+            
+            # Merge long-text fields to reduce noise
+            merged_fields = merge_long_text_fields(fields)
+            
+            planogram_rows.append(merged_fields)
         
-        print(f"[INFO] Found {len(planogram_rows)} Planogram rows")
+        logger.debug("Found %s Planogram rows", len(planogram_rows))
         return planogram_rows
     
     except Exception as e:
-        print(f"[ERROR] Failed to read Planogram rows: {e}")
+        logger.error("Failed to read Planogram rows: %s", e)
         return []
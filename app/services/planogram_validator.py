@@ -1,13 +1,31 @@
 """Data validator for Planogram data quality checks."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-import io
+import re
+from collections import Counter
 from dataclasses import dataclass
 from typing import List, Optional
 
+from app.services.excel_reference import read_reference_sheet
 
-@dataclass
+# Maximum number of failed records listed in a check's details
+MAX_DETAIL_ROWS = 10
+
+# Modular_Description: allowed text, and the characters reported when it is not
+_ALPHANUMERIC_PATTERN = re.compile(r'^[A-Za-z0-9\s]+$')
+_SPECIAL_CHAR_PATTERN = re.compile(r'[^A-Za-z0-9\s]')
+
+# Fields checked against the Excel reference file, with the words used in
+# their results: (plural, counted)
+REFERENCE_FIELDS = {
+    'Department': ('departments', 'department(s)'),
+    'Category': ('categories', 'category(ies)')
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of a single validation check."""
     check_name: str
@@ -18,6 +36,77 @@ class ValidationResult:
     details: str = ""
 
 
+def _blank_mask(values: pd.Series) -> np.ndarray:
+    """True where a value is null or blank (same as pd.isna(v) or str(v).strip() == '').
+    
+    Each distinct value is stripped once and taken back onto the column by its
+    factorized code, instead of once per row. Null values all get code -1,
+    so no separate isna() pass or string conversion of the column is needed;
+    categorical columns use their categories and codes directly, and
+    numeric/datetime columns (which have no blank text) only need isna().
+    """
+    if values.dtype.kind in 'biufcmM':
+        return values.isna().to_numpy()
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, uniques = pd.factorize(values)
+    # Code -1 (missing) picks the trailing True - a null value is blank
+    blank = np.array([str(value).strip() == '' for value in uniques] + [True], dtype=bool)
+    return blank[codes]
+
+
+def _parse_float_column(values: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert a column with float(str(v).strip()) semantics, without a per-row loop.
+    
+    Each distinct value is stripped and converted once (in a single NumPy
+    cast unless some value is not a number) and taken back onto the column by
+    its factorized code. Null values all get code -1, so for a text column
+    the same factorize also gives the null mask.
+    
+    Args:
+        values: Column to convert
+        
+    Returns:
+        Tuple of (float array - NaN where conversion fails or the value is null,
+        mask of values that converted, mask of null values)
+    """
+    codes, uniques = pd.factorize(values)
+    uniques = uniques.tolist()
+    if not all(isinstance(value, str) for value in uniques):
+        # Mixed values may factorize together (1 == 1.0 == True) - convert their str() instead
+        null_mask = values.isna().to_numpy()
+        codes, uniques = pd.factorize(values.astype(str))
+        codes[null_mask] = -1
+    stripped = [value.strip() for value in uniques]
+    converted = np.ones(len(stripped), dtype=bool)
+    try:
+        parsed = np.array(stripped, dtype=object).astype(float)
+    except ValueError:
+        parsed = np.empty(len(stripped))
+        for i, value in enumerate(stripped):
+            try:
+                parsed[i] = float(value)
+            except ValueError:
+                parsed[i] = np.nan
+                converted[i] = False
+    # Code -1 (null) picks the trailing NaN / not converted
+    parsed = np.append(parsed, np.nan)
+    converted = np.append(converted, False)
+    return parsed[codes], converted[codes], codes == -1
+
+
+def _distinct_codes(values: pd.Series) -> set:
+    """Distinct values of a code column as strings, leading zeros stripped ('0' if nothing is left).
+    
+    Same as {str(v).lstrip('0') or '0' for v in values.astype(str).unique()},
+    with the string work done by vectorized .str methods on the distinct
+    values only.
+    """
+    stripped = pd.Series(values.unique()).astype(str).str.lstrip('0')
+    return set(stripped.mask(stripped == '', '0'))
+
+
 class DataValidator:
     """Validates Planogram data with multiple quality checks."""
     
@@ -25,6 +114,29 @@ class DataValidator:
         self.df = df
         self.excel_reference_bytes = excel_reference_bytes
         self.results: List[ValidationResult] = []
+        self._excel_reference_df: Optional[pd.DataFrame] = None
+        self._excel_reference_error: Optional[Exception] = None
+    
+    def _load_excel_reference(self) -> pd.DataFrame:
+        """Read the 'handoff' sheet of the Excel reference file, once per validator.
+        
+        The Department and Category checks share the parsed sheet (a read
+        failure is remembered too, so a bad file is not parsed twice), and
+        validators given the same reference file share it through
+        read_reference_sheet.
+        
+        Returns:
+            DataFrame of the 'handoff' sheet
+        """
+        if self._excel_reference_error is not None:
+            raise self._excel_reference_error
+        if self._excel_reference_df is None:
+            try:
+                self._excel_reference_df = read_reference_sheet(self.excel_reference_bytes)
+            except Exception as e:
+                self._excel_reference_error = e
+                raise
+        return self._excel_reference_df
     
     def run_all_checks(self) -> List[ValidationResult]:
         """Run all validation checks and return results."""
@@ -50,15 +162,13 @@ class DataValidator:
     
     def get_summary(self) -> dict:
         """Get summary of validation results."""
-        passed = sum(1 for r in self.results if r.status == 'PASS')
-        failed = sum(1 for r in self.results if r.status == 'FAIL')
-        warnings = sum(1 for r in self.results if r.status == 'WARNING')
+        status_counts = Counter(r.status for r in self.results)
         
         return {
             'total_checks': len(self.results),
-            'passed': passed,
-            'failed': failed,
-            'warnings': warnings
+            'passed': status_counts['PASS'],
+            'failed': status_counts['FAIL'],
+            'warnings': status_counts['WARNING']
         }
     
     def check_print_fields_populated(self) -> ValidationResult:
@@ -88,29 +198,32 @@ class DataValidator:
             self.results.append(result)
             return result
         
-        # Check each row for empty Print fields
-        failed_rows = []
+        # Empty (None, empty string, or just whitespace) mask per Print field,
+        # one column each - a row with at least one empty Print field fails
+        empty_mask = np.column_stack([_blank_mask(self.df[field]) for field in print_fields])
+        failed_positions = np.flatnonzero(empty_mask.any(axis=1))
         
-        for idx, row in self.df.iterrows():
-            empty_fields = []
-            for field in print_fields:
-                value = row[field]
-                # Check if empty (None, empty string, or just whitespace)
-                if pd.isna(value) or str(value).strip() == '':
-                    empty_fields.append(field)
-            
-            if empty_fields:
-                # This row has at least one empty Print field - FAIL
-                failed_rows.append({
-                    'row': idx + 2,  # +2 because Excel is 1-indexed and has header
-                    'empty_fields': ', '.join(empty_fields),
-                    'table_name': row.get('Table_Name', 'N/A')
-                })
+        # Build records for the listed failures only
+        listed_positions = failed_positions[:MAX_DETAIL_ROWS]
+        # Table names of the listed rows only, taken in one go
+        if 'Table_Name' in self.df.columns:
+            table_names = self.df['Table_Name'].take(listed_positions).to_numpy()
+        else:
+            table_names = np.full(len(listed_positions), 'N/A', dtype=object)
+        failed_rows = []
+        for pos, table_name in zip(listed_positions, table_names):
+            failed_rows.append({
+                'row': self.df.index[pos] + 2,  # +2 because Excel is 1-indexed and has header
+                'empty_fields': ', '.join(
+                    field for field, empty in zip(print_fields, empty_mask[pos]) if empty
+                ),
+                'table_name': table_name
+            })
         
         # Build result
         total_rows = len(self.df)
-        pass_count = total_rows - len(failed_rows)
-        error_count = len(failed_rows)
+        error_count = len(failed_positions)
+        pass_count = total_rows - error_count
         
         if error_count == 0:
             result = ValidationResult(
@@ -127,13 +240,13 @@ class DataValidator:
             details_lines.append("\nFailed Records:")
             
             # Show first 10 failures
-            for fail in failed_rows[:10]:
+            for fail in failed_rows:
                 details_lines.append(
                     f"  Row {fail['row']} ({fail['table_name']}): Missing {fail['empty_fields']}"
                 )
             
-            if len(failed_rows) > 10:
-                details_lines.append(f"  ... and {len(failed_rows) - 10} more")
+            if error_count > MAX_DETAIL_ROWS:
+                details_lines.append(f"  ... and {error_count - MAX_DETAIL_ROWS} more")
             
             result = ValidationResult(
                 check_name=check_name,
@@ -148,120 +261,27 @@ class DataValidator:
         return result
     
     def check_department_against_excel_reference(self) -> ValidationResult:
-        """Validate that all Planogram Department values exist in Excel reference file.
-        
-        Requirement: ALL planogram departments must exist in the Excel reference file.
-        If any department is missing from Excel, the check fails.
-        
-        Returns:
-            ValidationResult with PASS/FAIL status
-        """
-        check_name = "Department Match Against Reference File"
-        
-        if not self.excel_reference_bytes:
-            result = ValidationResult(
-                check_name=check_name,
-                status="WARNING",
-                message="Excel reference file not provided - skipping validation",
-                error_count=0,
-                pass_count=0,
-                details="Upload an Excel reference file to enable this validation"
-            )
-            self.results.append(result)
-            return result
-        
-        try:
-            # Read Excel file from bytes
-            excel_df = pd.read_excel(io.BytesIO(self.excel_reference_bytes), sheet_name='handoff')
-            
-            # Check if Department column exists in Excel
-            if 'Department' not in excel_df.columns:
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="FAIL",
-                    message="Department column not found in Excel reference file",
-                    error_count=1,
-                    details=f"Excel columns: {list(excel_df.columns)}"
-                )
-                self.results.append(result)
-                return result
-            
-            # Check if Department column exists in planogram data
-            if 'Department' not in self.df.columns:
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="WARNING",
-                    message="Department column not found in planogram data",
-                    error_count=0,
-                    details="Cannot validate - Department column missing from planogram"
-                )
-                self.results.append(result)
-                return result
-            
-            # Get valid departments from Excel (convert to strings and strip leading zeros)
-            valid_departments = set(
-                str(dept).lstrip('0') or '0' 
-                for dept in excel_df['Department'].astype(str).unique()
-            )
-            
-            # Get unique departments from planogram (strip leading zeros)
-            planogram_departments = set(
-                str(dept).lstrip('0') or '0' 
-                for dept in self.df['Department'].astype(str).unique()
-            )
-            
-            # Check if all planogram departments exist in Excel
-            missing_departments = planogram_departments - valid_departments
-            
-            total_planogram_depts = len(planogram_departments)
-            
-            if missing_departments:
-                error_count = len(missing_departments)
-                pass_count = total_planogram_depts - error_count
-                
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="FAIL",
-                    message=f"Planogram contains {error_count} department(s) not in reference file: {', '.join(sorted(missing_departments))}",
-                    error_count=error_count,
-                    pass_count=pass_count,
-                    details=f"Valid departments in Excel: {', '.join(sorted(valid_departments))}"
-                )
-            else:
-                # All departments match!
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="PASS",
-                    message=f"All {total_planogram_depts} planogram department(s) match reference file: {', '.join(sorted(planogram_departments))}",
-                    error_count=0,
-                    pass_count=total_planogram_depts,
-                    details=f"Validated against {len(valid_departments)} reference department(s) from Excel"
-                )
-            
-            self.results.append(result)
-            return result
-        
-        except Exception as e:
-            result = ValidationResult(
-                check_name=check_name,
-                status="FAIL",
-                message=f"Error reading Excel reference file: {str(e)}",
-                error_count=1,
-                details="Check that the Excel file format is correct and contains a 'handoff' sheet"
-            )
-            self.results.append(result)
-            return result
+        """Validate that all Planogram Department values exist in Excel reference file."""
+        return self._check_field_against_reference('Department')
     
     def check_category_against_excel_reference(self) -> ValidationResult:
-        """Validate that all Planogram Category values exist in Excel reference file.
+        """Validate that all Planogram Category values exist in Excel reference file."""
+        return self._check_field_against_reference('Category')
+    
+    def _check_field_against_reference(self, field: str) -> ValidationResult:
+        """Validate that all Planogram values of a field exist in Excel reference file.
         
-        Requirement: ALL planogram categories must exist in the Excel reference file.
-        If any category is missing from Excel, the check fails.
+        Requirement: ALL planogram values must exist in the Excel reference file.
+        If any value is missing from Excel, the check fails.
         
+        Args:
+            field: Column checked in both files (a key of REFERENCE_FIELDS)
+            
         Returns:
             ValidationResult with PASS/FAIL status
         """
-        check_name = "Category Match Against Reference File"
+        plural, counted = REFERENCE_FIELDS[field]
+        check_name = f"{field} Match Against Reference File"
         
         if not self.excel_reference_bytes:
             result = ValidationResult(
@@ -276,71 +296,65 @@ class DataValidator:
             return result
         
         try:
-            # Read Excel file from bytes
-            excel_df = pd.read_excel(io.BytesIO(self.excel_reference_bytes), sheet_name='handoff')
+            # Read Excel file from bytes (parsed once, shared by the reference checks)
+            excel_df = self._load_excel_reference()
             
-            # Check if Category column exists in Excel
-            if 'Category' not in excel_df.columns:
+            # Check if the column exists in Excel
+            if field not in excel_df.columns:
                 result = ValidationResult(
                     check_name=check_name,
                     status="FAIL",
-                    message="Category column not found in Excel reference file",
+                    message=f"{field} column not found in Excel reference file",
                     error_count=1,
                     details=f"Excel columns: {list(excel_df.columns)}"
                 )
                 self.results.append(result)
                 return result
             
-            # Check if Category column exists in planogram data
-            if 'Category' not in self.df.columns:
+            # Check if the column exists in planogram data
+            if field not in self.df.columns:
                 result = ValidationResult(
                     check_name=check_name,
                     status="WARNING",
-                    message="Category column not found in planogram data",
+                    message=f"{field} column not found in planogram data",
                     error_count=0,
-                    details="Cannot validate - Category column missing from planogram"
+                    details=f"Cannot validate - {field} column missing from planogram"
                 )
                 self.results.append(result)
                 return result
             
-            # Get valid categories from Excel (convert to strings and strip leading zeros)
-            valid_categories = set(
-                str(cat).lstrip('0') or '0' 
-                for cat in excel_df['Category'].astype(str).unique()
-            )
+            # Get valid values from Excel (convert to strings and strip leading zeros)
+            valid_values = _distinct_codes(excel_df[field])
             
-            # Get unique categories from planogram (strip leading zeros)
-            planogram_categories = set(
-                str(cat).lstrip('0') or '0' 
-                for cat in self.df['Category'].astype(str).unique()
-            )
+            # Get unique values from planogram (strip leading zeros)
+            planogram_values = _distinct_codes(self.df[field])
             
-            # Check if all planogram categories exist in Excel
-            missing_categories = planogram_categories - valid_categories
+            # Check if all planogram values exist in Excel
+            missing_values = planogram_values - valid_values
             
-            total_planogram_cats = len(planogram_categories)
+            total_planogram_values = len(planogram_values)
             
-            if missing_categories:
-                error_count = len(missing_categories)
-                pass_count = total_planogram_cats - error_count
+            if missing_values:
+                error_count = len(missing_values)
+                pass_count = total_planogram_values - error_count
                 
                 result = ValidationResult(
                     check_name=check_name,
                     status="FAIL",
-                    message=f"Planogram contains {error_count} category(ies) not in reference file: {', '.join(sorted(missing_categories))}",
+                    message=f"Planogram contains {error_count} {counted} not in reference file: {', '.join(sorted(missing_values))}",
                     error_count=error_count,
                     pass_count=pass_count,
-                    details=f"Valid categories in Excel: {', '.join(sorted(valid_categories))}"
+                    details=f"Valid {plural} in Excel: {', '.join(sorted(valid_values))}"
                 )
             else:
-                # All categories match!
+                # All values match!
                 result = ValidationResult(
                     check_name=check_name,
                     status="PASS",
-                    message=f"All {total_planogram_cats} planogram category(ies) match reference file: {', '.join(sorted(planogram_categories))}",
+                    message=f"All {total_planogram_values} planogram {counted} match reference file: {', '.join(sorted(planogram_values))}",
                     error_count=0,
-                    pass_count=total_planogram_cats,
-                    details=f"Validated against {len(valid_categories)} reference category(ies) from Excel"
+                    pass_count=total_planogram_values,
+                    details=f"Validated against {len(valid_values)} reference {counted} from Excel"
                 )
             
             self.results.append(result)
@@ -377,45 +391,54 @@ class DataValidator:
             self.results.append(result)
             return result
         
+        footage = self.df['Footage']
+        width_feet = self.df['Width_Feet']
+        
+        # Null rows fail first, then rows that do not convert to numbers
+        # (leading zeros are fine), then values that differ by more than a
+        # small floating point tolerance (NaN differences never do)
+        footage_floats, footage_ok, footage_null = _parse_float_column(footage)
+        width_feet_floats, width_feet_ok, width_feet_null = _parse_float_column(width_feet)
+        null_mask = footage_null | width_feet_null
+        convert_fail = ~null_mask & ~(footage_ok & width_feet_ok)
+        with np.errstate(invalid='ignore'):
+            mismatch = np.abs(footage_floats - width_feet_floats) > 0.01
+        mismatch &= ~null_mask & ~convert_fail
+        failed_positions = np.flatnonzero(null_mask | convert_fail | mismatch)
+        
+        # Build records for the listed failures only
         failed_rows = []
-        
-        for idx, row in self.df.iterrows():
-            footage_val = row['Footage']
-            width_feet_val = row['Width_Feet']
+        for pos in failed_positions[:MAX_DETAIL_ROWS]:
+            idx = self.df.index[pos]
+            footage_val = footage.iat[pos]
+            width_feet_val = width_feet.iat[pos]
             
-            # Skip if either is null/empty
-            if pd.isna(footage_val) or pd.isna(width_feet_val):
+            if null_mask[pos]:
                 failed_rows.append({
                     'row': idx + 2,
                     'footage': str(footage_val),
                     'width_feet': str(width_feet_val),
                     'reason': 'One or both values are null'
                 })
-                continue
-            
-            try:
-                # Convert to float (handles leading zeros)
-                footage_float = float(str(footage_val).strip())
-                width_feet_float = float(str(width_feet_val).strip())
-                
-                # Compare with small tolerance for floating point
-                if abs(footage_float - width_feet_float) > 0.01:
-                    failed_rows.append({
-                        'row': idx + 2,
-                        'footage': footage_float,
-                        'width_feet': width_feet_float,
-                        'reason': f'{footage_float} != {width_feet_float}'
-                    })
-            except (ValueError, TypeError):
+            elif convert_fail[pos]:
                 failed_rows.append({
                     'row': idx + 2,
                     'footage': str(footage_val),
                     'width_feet': str(width_feet_val),
                     'reason': 'Cannot convert to number'
                 })
+            else:
+                footage_float = float(footage_floats[pos])
+                width_feet_float = float(width_feet_floats[pos])
+                failed_rows.append({
+                    'row': idx + 2,
+                    'footage': footage_float,
+                    'width_feet': width_feet_float,
+                    'reason': f'{footage_float} != {width_feet_float}'
+                })
         
         total_rows = len(self.df)
-        error_count = len(failed_rows)
+        error_count = len(failed_positions)
         pass_count = total_rows - error_count
         
         if error_count == 0:
@@ -429,12 +452,12 @@ class DataValidator:
         else:
             details_lines = [f"Total mismatches: {error_count}/{total_rows}"]
             details_lines.append("\nFailed Records:")
-            for fail in failed_rows[:10]:
+            for fail in failed_rows:
                 details_lines.append(
                     f"  Row {fail['row']}: Footage={fail['footage']}, Width_Feet={fail['width_feet']} ({fail['reason']})"
                 )
-            if len(failed_rows) > 10:
-                details_lines.append(f"  ... and {len(failed_rows) - 10} more")
+            if error_count > MAX_DETAIL_ROWS:
+                details_lines.append(f"  ... and {error_count - MAX_DETAIL_ROWS} more")
             
             result = ValidationResult(
                 check_name=check_name,
@@ -448,111 +471,6 @@ class DataValidator:
         self.results.append(result)
         return result
     
-    def check_department_against_excel_reference(self) -> ValidationResult:
-        """Validate that all Planogram Department values exist in Excel reference file.
-        
-        Requirement: ALL planogram departments must exist in the Excel reference file.
-        If any department is missing from Excel, the check fails.
-        
-        Returns:
-            ValidationResult with PASS/FAIL status
-        """
-        check_name = "Department Match Against Reference File"
-        
-        if not self.excel_reference_bytes:
-            result = ValidationResult(
-                check_name=check_name,
-                status="WARNING",
-                message="Excel reference file not provided - skipping validation",
-                error_count=0,
-                pass_count=0,
-                details="Upload an Excel reference file to enable this validation"
-            )
-            self.results.append(result)
-            return result
-        
-        try:
-            # Read Excel file from bytes
-            excel_df = pd.read_excel(io.BytesIO(self.excel_reference_bytes), sheet_name='handoff')
-            
-            # Check if Department column exists in Excel
-            if 'Department' not in excel_df.columns:
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="FAIL",
-                    message="Department column not found in Excel reference file",
-                    error_count=1,
-                    details=f"Excel columns: {list(excel_df.columns)}"
-                )
-                self.results.append(result)
-                return result
-            
-            # Check if Department column exists in planogram data
-            if 'Department' not in self.df.columns:
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="WARNING",
-                    message="Department column not found in planogram data",
-                    error_count=0,
-                    details="Cannot validate - Department column missing from planogram"
-                )
-                self.results.append(result)
-                return result
-            
-            # Get valid departments from Excel (convert to strings and strip leading zeros)
-            valid_departments = set(
-                str(dept).lstrip('0') or '0' 
-                for dept in excel_df['Department'].astype(str).unique()
-            )
-            
-            # Get unique departments from planogram (strip leading zeros)
-            planogram_departments = set(
-                str(dept).lstrip('0') or '0' 
-                for dept in self.df['Department'].astype(str).unique()
-            )
-            
-            # Check if all planogram departments exist in Excel
-            missing_departments = planogram_departments - valid_departments
-            
-            total_planogram_depts = len(planogram_departments)
-            
-            if missing_departments:
-                error_count = len(missing_departments)
-                pass_count = total_planogram_depts - error_count
-                
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="FAIL",
-                    message=f"Planogram contains {error_count} department(s) not in reference file: {', '.join(sorted(missing_departments))}",
-                    error_count=error_count,
-                    pass_count=pass_count,
-                    details=f"Valid departments in Excel: {', '.join(sorted(valid_departments))}"
-                )
-            else:
-                # All departments match!
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="PASS",
-                    message=f"All {total_planogram_depts} planogram department(s) match reference file: {', '.join(sorted(planogram_departments))}",
-                    error_count=0,
-                    pass_count=total_planogram_depts,
-                    details=f"Validated against {len(valid_departments)} reference department(s) from Excel"
-                )
-            
-            self.results.append(result)
-            return result
-        
-        except Exception as e:
-            result = ValidationResult(
-                check_name=check_name,
-                status="FAIL",
-                message=f"Error reading Excel reference file: {str(e)}",
-                error_count=1,
-                details="Check that the Excel file format is correct and contains a 'handoff' sheet"
-            )
-            self.results.append(result)
-            return result
-    
     def check_drawing_id_not_null(self) -> ValidationResult:
         """Check if Drawing_ID is not null."""
         return self._check_field_not_null('Drawing_ID')
@@ -600,12 +518,11 @@ class DataValidator:
             self.results.append(result)
             return result
         
-        # Find null/empty rows
-        null_mask = self.df[field_name].isna() | (self.df[field_name].astype(str).str.strip() == '')
-        null_rows = self.df[null_mask]
+        # Find null/empty rows - positions only, no filtered copy of the frame
+        null_positions = np.flatnonzero(_blank_mask(self.df[field_name]))
         
         total_rows = len(self.df)
-        error_count = len(null_rows)
+        error_count = len(null_positions)
         pass_count = total_rows - error_count
         
         if error_count == 0:
@@ -618,12 +535,12 @@ class DataValidator:
             )
         else:
             # Get row numbers
-            failed_row_numbers = [idx + 2 for idx in null_rows.index][:10]
+            failed_row_numbers = (self.df.index[null_positions[:MAX_DETAIL_ROWS]] + 2).tolist()
             
             details_lines = [f"Total null/empty {field_name}: {error_count}/{total_rows}"]
             details_lines.append(f"\nFailed Rows: {', '.join(map(str, failed_row_numbers))}")
-            if error_count > 10:
-                details_lines.append(f"... and {error_count - 10} more")
+            if error_count > MAX_DETAIL_ROWS:
+                details_lines.append(f"... and {error_count - MAX_DETAIL_ROWS} more")
             
             result = ValidationResult(
                 check_name=check_name,
@@ -637,111 +554,6 @@ class DataValidator:
         self.results.append(result)
         return result
     
-    def check_department_against_excel_reference(self) -> ValidationResult:
-        """Validate that all Planogram Department values exist in Excel reference file.
-        
-        Requirement: ALL planogram departments must exist in the Excel reference file.
-        If any department is missing from Excel, the check fails.
-        
-        Returns:
-            ValidationResult with PASS/FAIL status
-        """
-        check_name = "Department Match Against Reference File"
-        
-        if not self.excel_reference_bytes:
-            result = ValidationResult(
-                check_name=check_name,
-                status="WARNING",
-                message="Excel reference file not provided - skipping validation",
-                error_count=0,
-                pass_count=0,
-                details="Upload an Excel reference file to enable this validation"
-            )
-            self.results.append(result)
-            return result
-        
-        try:
-            # Read Excel file from bytes
-            excel_df = pd.read_excel(io.BytesIO(self.excel_reference_bytes), sheet_name='handoff')
-            
-            # Check if Department column exists in Excel
-            if 'Department' not in excel_df.columns:
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="FAIL",
-                    message="Department column not found in Excel reference file",
-                    error_count=1,
-                    details=f"Excel columns: {list(excel_df.columns)}"
-                )
-                self.results.append(result)
-                return result
-            
-            # Check if Department column exists in planogram data
-            if 'Department' not in self.df.columns:
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="WARNING",
-                    message="Department column not found in planogram data",
-                    error_count=0,
-                    details="Cannot validate - Department column missing from planogram"
-                )
-                self.results.append(result)
-                return result
-            
-            # Get valid departments from Excel (convert to strings and strip leading zeros)
-            valid_departments = set(
-                str(dept).lstrip('0') or '0' 
-                for dept in excel_df['Department'].astype(str).unique()
-            )
-            
-            # Get unique departments from planogram (strip leading zeros)
-            planogram_departments = set(
-                str(dept).lstrip('0') or '0' 
-                for dept in self.df['Department'].astype(str).unique()
-            )
-            
-            # Check if all planogram departments exist in Excel
-            missing_departments = planogram_departments - valid_departments
-            
-            total_planogram_depts = len(planogram_departments)
-            
-            if missing_departments:
-                error_count = len(missing_departments)
-                pass_count = total_planogram_depts - error_count
-                
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="FAIL",
-                    message=f"Planogram contains {error_count} department(s) not in reference file: {', '.join(sorted(missing_departments))}",
-                    error_count=error_count,
-                    pass_count=pass_count,
-                    details=f"Valid departments in Excel: {', '.join(sorted(valid_departments))}"
-                )
-            else:
-                # All departments match!
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="PASS",
-                    message=f"All {total_planogram_depts} planogram department(s) match reference file: {', '.join(sorted(planogram_departments))}",
-                    error_count=0,
-                    pass_count=total_planogram_depts,
-                    details=f"Validated against {len(valid_departments)} reference department(s) from Excel"
-                )
-            
-            self.results.append(result)
-            return result
-        
-        except Exception as e:
-            result = ValidationResult(
-                check_name=check_name,
-                status="FAIL",
-                message=f"Error reading Excel reference file: {str(e)}",
-                error_count=1,
-                details="Check that the Excel file format is correct and contains a 'handoff' sheet"
-            )
-            self.results.append(result)
-            return result
-    
     def check_modular_description_alphanumeric(self) -> ValidationResult:
         """Check if Modular_Description contains only letters and numbers (no special characters).
         
@@ -762,30 +574,41 @@ class DataValidator:
             self.results.append(result)
             return result
         
-        import re
-        failed_rows = []
+        descriptions = self.df['Modular_Description']
         
-        for idx, row in self.df.iterrows():
-            value = row['Modular_Description']
-            
-            # Skip if null/empty
-            if pd.isna(value) or str(value).strip() == '':
-                continue
-            
-            value_str = str(value)
-            
-            # Check if contains only alphanumeric characters and spaces
-            if not re.match(r'^[A-Za-z0-9\s]+$', value_str):
-                # Find the special characters
-                special_chars = re.findall(r'[^A-Za-z0-9\s]', value_str)
-                failed_rows.append({
-                    'row': idx + 2,
-                    'value': value_str[:50],  # Truncate if long
-                    'special_chars': ', '.join(set(special_chars))
-                })
+        # Check if contains only alphanumeric characters and spaces - once per
+        # distinct value, taken back onto the rows by code; null/empty skipped
+        codes, uniques = pd.factorize(descriptions)
+        uniques = uniques.tolist()
+        if all(isinstance(value, str) for value in uniques):
+            # Text column (the usual case) - the one factorize gives both the
+            # pattern and the blank test; code -1 (null) picks the trailing False
+            failing = np.array(
+                [value.strip() != '' and not _ALPHANUMERIC_PATTERN.match(value) for value in uniques] + [False],
+                dtype=bool
+            )
+            failed_mask = failing[codes]
+        else:
+            # Mixed values may factorize together (1 == 1.0) - match their str() instead
+            codes, uniques = pd.factorize(descriptions.astype(str))
+            special = np.array([not _ALPHANUMERIC_PATTERN.match(value) for value in uniques], dtype=bool)
+            failed_mask = special[codes] & ~_blank_mask(descriptions)
+        failed_positions = np.flatnonzero(failed_mask)
+        
+        # Build records for the listed failures only
+        failed_rows = []
+        for pos in failed_positions[:MAX_DETAIL_ROWS]:
+            value_str = uniques[codes[pos]]
+            # Find the special characters
+            special_chars = _SPECIAL_CHAR_PATTERN.findall(value_str)
+            failed_rows.append({
+                'row': self.df.index[pos] + 2,
+                'value': value_str[:50],  # Truncate if long
+                'special_chars': ', '.join(set(special_chars))
+            })
         
         total_rows = len(self.df)
-        error_count = len(failed_rows)
+        error_count = len(failed_positions)
         pass_count = total_rows - error_count
         
         if error_count == 0:
@@ -799,12 +622,12 @@ class DataValidator:
         else:
             details_lines = [f"Total records with special characters: {error_count}/{total_rows}"]
             details_lines.append("\nFailed Records (showing first 10):")
-            for fail in failed_rows[:10]:
+            for fail in failed_rows:
                 details_lines.append(
                     f"  Row {fail['row']}: '{fail['value']}...' (special chars: {fail['special_chars']})"
                 )
-            if len(failed_rows) > 10:
-                details_lines.append(f"  ... and {len(failed_rows) - 10} more")
+            if error_count > MAX_DETAIL_ROWS:
+                details_lines.append(f"  ... and {error_count - MAX_DETAIL_ROWS} more")
             
             result = ValidationResult(
                 check_name=check_name,
@@ -817,108 +640,3 @@ class DataValidator:
         
         self.results.append(result)
         return result
-    
-    def check_department_against_excel_reference(self) -> ValidationResult:
-        """Validate that all Planogram Department values exist in Excel reference file.
-        
-        Requirement: ALL planogram departments must exist in the Excel reference file.
-        If any department is missing from Excel, the check fails.
-        
-        Returns:
-            ValidationResult with PASS/FAIL status
-        """
-        check_name = "Department Match Against Reference File"
-        
-        if not self.excel_reference_bytes:
-            result = ValidationResult(
-                check_name=check_name,
-                status="WARNING",
-                message="Excel reference file not provided - skipping validation",
-                error_count=0,
-                pass_count=0,
-                details="Upload an Excel reference file to enable this validation"
-            )
-            self.results.append(result)
-            return result
-        
-        try:
-            # Read Excel file from bytes
-            excel_df = pd.read_excel(io.BytesIO(self.excel_reference_bytes), sheet_name='handoff')
-            
-            # Check if Department column exists in Excel
-            if 'Department' not in excel_df.columns:
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="FAIL",
-                    message="Department column not found in Excel reference file",
-                    error_count=1,
-                    details=f"Excel columns: {list(excel_df.columns)}"
-                )
-                self.results.append(result)
-                return result
-            
-            # Check if Department column exists in planogram data
-            if 'Department' not in self.df.columns:
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="WARNING",
-                    message="Department column not found in planogram data",
-                    error_count=0,
-                    details="Cannot validate - Department column missing from planogram"
-                )
-                self.results.append(result)
-                return result
-            
-            # Get valid departments from Excel (convert to strings and strip leading zeros)
-            valid_departments = set(
-                str(dept).lstrip('0') or '0' 
-                for dept in excel_df['Department'].astype(str).unique()
-            )
-            
-            # Get unique departments from planogram (strip leading zeros)
-            planogram_departments = set(
-                str(dept).lstrip('0') or '0' 
-                for dept in self.df['Department'].astype(str).unique()
-            )
-            
-            # Check if all planogram departments exist in Excel
-            missing_departments = planogram_departments - valid_departments
-            
-            total_planogram_depts = len(planogram_departments)
-            
-            if missing_departments:
-                error_count = len(missing_departments)
-                pass_count = total_planogram_depts - error_count
-                
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="FAIL",
-                    message=f"Planogram contains {error_count} department(s) not in reference file: {', '.join(sorted(missing_departments))}",
-                    error_count=error_count,
-                    pass_count=pass_count,
-                    details=f"Valid departments in Excel: {', '.join(sorted(valid_departments))}"
-                )
-            else:
-                # All departments match!
-                result = ValidationResult(
-                    check_name=check_name,
-                    status="PASS",
-                    message=f"All {total_planogram_depts} planogram department(s) match reference file: {', '.join(sorted(planogram_departments))}",
-                    error_count=0,
-                    pass_count=total_planogram_depts,
-                    details=f"Validated against {len(valid_departments)} reference department(s) from Excel"
-                )
-            
-            self.results.append(result)
-            return result
-        
-        except Exception as e:
-            result = ValidationResult(
-                check_name=check_name,
-                status="FAIL",
-                message=f"Error reading Excel reference file: {str(e)}",
-                error_count=1,
-                details="Check that the Excel file format is correct and contains a 'handoff' sheet"
-            )
-            self.results.append(result)
-            return result
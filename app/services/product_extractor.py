@@ -1,7 +1,9 @@
 """Extract and validate Product data from PSA files."""
 from __future__ import annotations
 
+import logging
 from typing import Tuple, List, Optional
+import numpy as np
 import pandas as pd
 
 from app.services.product_psa_reader import read_product_rows_from_bytes
@@ -9,6 +11,8 @@ from app.services.xlsx_writer import create_standard_headers
 from app.services.product_column_remapper import remap_and_clean_columns
 from app.services.product_validator import DataValidator, ValidationResult
 
+logger = logging.getLogger(__name__)
+
 
 def extract_product_data(
     psa_bytes: bytes,
@@ -27,35 +31,37 @@ def extract_product_data(
         - Summary dict (passed, failed, warnings counts)
     """
     
-    print("[PRODUCT] Starting extraction...")
+    logger.debug("Starting extraction...")
     
     # Step 1: Extract Product rows
     product_rows = read_product_rows_from_bytes(psa_bytes)
     if not product_rows:
         raise ValueError("No Product rows found in PSA file")
     
-    print(f"[PRODUCT] Extracted {len(product_rows)} records")
+    logger.debug("Extracted %s records", len(product_rows))
     
     # Step 2: Create DataFrame with standardized headers
-    max_cols = max(len(r) for r in product_rows)
+    max_cols = max(map(len, product_rows))
     headers = create_standard_headers(max_cols)
     
-    # Pad rows to match max columns
-    padded_rows = [row + [''] * (max_cols - len(row)) for row in product_rows]
-    df = pd.DataFrame(padded_rows, columns=headers)
+    # Fill one object array, padded with '' to max columns, and wrap it as is
+    values = np.full((len(product_rows), max_cols), '', dtype=object)
+    for i, row in enumerate(product_rows):
+        values[i, :len(row)] = row
+    df = pd.DataFrame(values, columns=headers, copy=False)
     
-    print(f"[PRODUCT] Created DataFrame with {len(df.columns)} columns")
+    logger.debug("Created DataFrame with %s columns", len(df.columns))
     
     # Step 3: Remap and clean columns
     df_cleaned = remap_and_clean_columns(df)
-    print(f"[PRODUCT] Cleaned to {len(df_cleaned.columns)} columns")
+    logger.debug("Cleaned to %s columns", len(df_cleaned.columns))
     
     # Step 4: Run validation checks
-    print(f"[PRODUCT] Running validation checks...")
+    logger.debug("Running validation checks...")
     validator = DataValidator(df_cleaned, excel_reference_bytes=excel_reference_bytes)
     validation_results = validator.run_all_checks()
     summary = validator.get_summary()
     
-    print(f"[PRODUCT] Validation complete: {summary['passed']} passed, {summary['failed']} failed")
+    logger.debug("Validation complete: %s passed, %s failed", summary['passed'], summary['failed'])
     
     return df_cleaned, validation_results, summary
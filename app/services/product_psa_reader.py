@@ -1,6 +1,50 @@
 from __future__ import annotations
 
 import csv
+import re
+
+
+# Longest raw text that unescapes to "Product" (every letter escaped) - a
+# Product line without a backslash this early starts with "Product" itself
+PRODUCT_FIELD_MAX_RAW_LENGTH = 2 * len("Product")
+
+# Lines end at the same bytes str.splitlines() breaks on after a cp1252
+# decode (which maps every byte to exactly one character)
+_LINE_SEPARATOR_PATTERN = re.compile(rb'\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e]')
+_SEPARATORS_TO_NEWLINE = bytes.maketrans(b'\r\x0b\x0c\x1c\x1d\x1e', b'\n' * 6)
+
+# Product line starts - "Product" in a file where no letter of "Product" is
+# ever escaped, otherwise any "P" or backslash (a first field that unescapes
+# to "Product" starts with one of the two)
+_PRODUCT_START_PATTERN = re.compile(rb'Product')
+_ESCAPED_PRODUCT_LETTER_PATTERN = re.compile(rb'\\[Prodct]')
+_CANDIDATE_START_PATTERN = re.compile(rb'[P\\]')
+
+# Lines before the Product rows (the PSA header)
+PSA_HEADER_LINES = 3
+
+# A backslash escape: the backslash and the character it escapes
+_ESCAPE_PATTERN = re.compile(r'\\(.)', re.DOTALL)
+
+
+def _join_escaped_commas(parts: list[str]) -> list[str]:
+    """Join comma-split parts back together where the comma was escaped.
+    
+    A comma is escaped when the part before it ends in an odd run of
+    backslashes (the last backslash pairs with the comma). The parts of one
+    field are collected and joined once, however many escaped commas it has.
+    """
+    fields = []
+    pending = []
+    for part in parts:
+        pending.append(part)
+        if not (len(part) - len(part.rstrip('\\'))) % 2:
+            fields.append(','.join(pending))
+            pending = []
+    if pending:
+        # Trailing lone backslash at the end of the line - a regular character
+        fields.append(','.join(pending))
+    return fields
 
 
 def parse_psa_line(line: str) -> list[str]:
@@ -12,41 +56,46 @@ def parse_psa_line(line: str) -> list[str]:
     - Backslash escapes special characters like commas within text fields
     - Strategy: look ahead - if we see backslash-comma, that indicates an escaped char
     - Example: MS 6FT TBL\\, WHT is a single field = 'MS 6FT TBL, WHT'
+    
+    The line is split with str.split and only fields containing a backslash
+    are unescaped, instead of walking the line one character at a time.
     """
-    fields = []
-    current_field = []
-    i = 0
-    backslash = chr(92)  # Backslash character
+    if not line:
+        return []
     
-    while i < len(line):
-        char = line[i]
-        
-        # Check for escape sequence (backslash followed by a character)
-        if char == backslash and i + 1 < len(line):
-            next_char = line[i + 1]
-            # Add the escaped character (unescaped)
-            if next_char == ',':
-                # Escaped comma - add it as a regular comma to the field
-                current_field.append(',')
-            else:
-                # Other escape - add the escaped character
-                current_field.append(next_char)
-            i += 2  # Skip both the backslash and the next character
-        elif char == ',':
-            # Unescaped comma = field separator
-            fields.append(''.join(current_field))
-            current_field = []
-            i += 1
-        else:
-            # Regular character
-            current_field.append(char)
-            i += 1
+    if '\\' not in line:
+        return line.split(',')
     
-    # Don't forget the last field
-    if current_field or (line and line[-1] == ','):
-        fields.append(''.join(current_field))
+    if '\\\\' in line:
+        # Backslash runs - pair them up part by part
+        fields = _join_escaped_commas(line.split(','))
+    else:
+        # Every backslash-comma is an escaped comma - split around those first,
+        # joining the pieces on each side back together with a plain comma
+        chunks = line.split('\\,')
+        fields = chunks[0].split(',')
+        for chunk in chunks[1:]:
+            parts = chunk.split(',')
+            fields[-1] += ',' + parts[0]
+            fields.extend(parts[1:])
+        if line.count('\\') == len(chunks) - 1:
+            # Escaped commas were the only escapes
+            return fields
     
-    return fields
+    # Unescape (backslash + character -> character); a trailing lone backslash stays
+    return [_ESCAPE_PATTERN.sub(r'\1', field) if '\\' in field else field for field in fields]
+
+
+def _body_start(psa_bytes: bytes) -> int:
+    """Byte offset of the first line after the PSA header, -1 if there is none."""
+    separators = _LINE_SEPARATOR_PATTERN.finditer(psa_bytes)
+    end = -1
+    for _ in range(PSA_HEADER_LINES):
+        separator = next(separators, None)
+        if separator is None:
+            return -1
+        end = separator.end()
+    return end
 
 
 def read_product_rows_from_bytes(psa_bytes: bytes) -> list[list[str]]:
@@ -54,14 +103,34 @@ def read_product_rows_from_bytes(psa_bytes: bytes) -> list[list[str]]:
     
     Uses custom parser to handle ProSpace escape sequences (escaped commas).
     Keeps Field_0 (the 'Product' text) to maintain consistency with original PSA structure.
+    
+    Scans the raw bytes for the starts of candidate lines, so only those
+    lines are ever decoded - the file is never decoded or split into a list
+    of lines as a whole.
     """
+    body_start = _body_start(psa_bytes)  # Skip PSA header
+    if body_start < 0:
+        return []
 
-    text = psa_bytes.decode("cp1252", errors="replace")
-    lines = text.splitlines()
+    # Every line separator as b'\n', so a line ends at the next b'\n'
+    # (a CRLF becomes two, which only adds empty lines)
+    lines_bytes = bytes(psa_bytes).translate(_SEPARATORS_TO_NEWLINE)
+    if _ESCAPED_PRODUCT_LETTER_PATTERN.search(lines_bytes, body_start):
+        start_pattern = _CANDIDATE_START_PATTERN
+    else:
+        start_pattern = _PRODUCT_START_PATTERN
 
     product_rows: list[list[str]] = []
-    for line in lines[3:]:  # Skip PSA header
-        fields = parse_psa_line(line)
+    for match in start_pattern.finditer(lines_bytes, body_start):
+        pos = match.start()
+        if pos > body_start and lines_bytes[pos - 1] != 0x0A:
+            continue  # Mid-line match
+        end = lines_bytes.find(b"\n", pos)
+        raw_line = lines_bytes[pos:end] if end >= 0 else lines_bytes[pos:]
+        # Only parse lines whose first field can unescape to "Product"
+        if not raw_line.startswith(b"Product") and b"\\" not in raw_line[:PRODUCT_FIELD_MAX_RAW_LENGTH]:
+            continue
+        fields = parse_psa_line(raw_line.decode("cp1252", errors="replace"))
         if fields and fields[0] == "Product":
             product_rows.append(fields)  # Keep all fields including 'Product'
 
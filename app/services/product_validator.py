@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import io
 import pandas as pd
+from collections import Counter
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+from app.services.excel_reference import read_reference_sheet
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of a single validation check."""
     check_name: str
@@ -1660,7 +1662,7 @@ class DataValidator:
         
         try:
             # Read Excel file from bytes
-            excel_df = pd.read_excel(io.BytesIO(self.excel_reference_bytes), sheet_name='handoff')
+            excel_df = read_reference_sheet(self.excel_reference_bytes)
             
             # Check if required columns exist in Excel
             if 'Has_Alt_UPC' not in excel_df.columns:
@@ -1747,9 +1749,10 @@ class DataValidator:
     def get_summary(self) -> dict:
         """Get summary of all validation results."""
         total_checks = len(self.results)
-        passed = sum(1 for r in self.results if r.status == 'PASS')
-        failed = sum(1 for r in self.results if r.status == 'FAIL')
-        warnings = sum(1 for r in self.results if r.status == 'WARNING')
+        status_counts = Counter(r.status for r in self.results)
+        passed = status_counts['PASS']
+        failed = status_counts['FAIL']
+        warnings = status_counts['WARNING']
         total_errors = sum(r.error_count for r in self.results)
         
         return {
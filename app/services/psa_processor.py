@@ -1,6 +1,7 @@
 """Orchestrate PSA file processing for all tables."""
 from __future__ import annotations
 
+import logging
 from typing import Dict, Any, Optional
 import pandas as pd
 
@@ -8,6 +9,8 @@ from app.services.product_extractor import extract_product_data
 from app.services.planogram_extractor import extract_planogram_data
 from app.services.fixture_extractor import extract_fixture_data
 
+logger = logging.getLogger(__name__)
+
 
 def process_psa_file(
     psa_bytes: bytes,
@@ -34,9 +37,7 @@ def process_psa_file(
         - 'fixture_summary': Summary dict
     """
     
-    print("="*80)
-    print("PSA PROCESSOR: Starting multi-table extraction")
-    print("="*80)
+    logger.info("Starting multi-table extraction")
     
     result = {}
     
@@ -49,9 +50,9 @@ def process_psa_file(
         result['product_df'] = product_df
         result['product_validation'] = product_validation
         result['product_summary'] = product_summary
-        print(f"[SUCCESS] Product: {len(product_df)} rows, {len(product_df.columns)} columns")
+        logger.info("Product: %s rows, %s columns", len(product_df), len(product_df.columns))
     except Exception as e:
-        print(f"[ERROR] Product extraction failed: {e}")
+        logger.error("Product extraction failed: %s", e)
         result['product_df'] = None
         result['product_validation'] = []
         result['product_summary'] = {'total_checks': 0, 'passed': 0, 'failed': 0, 'warnings': 0}
@@ -65,9 +66,9 @@ def process_psa_file(
         result['planogram_df'] = planogram_df
         result['planogram_validation'] = planogram_validation
         result['planogram_summary'] = planogram_summary
-        print(f"[SUCCESS] Planogram: {len(planogram_df)} rows, {len(planogram_df.columns)} columns")
+        logger.info("Planogram: %s rows, %s columns", len(planogram_df), len(planogram_df.columns))
     except Exception as e:
-        print(f"[ERROR] Planogram extraction failed: {e}")
+        logger.error("Planogram extraction failed: %s", e)
         result['planogram_df'] = None
         result['planogram_validation'] = []
         result['planogram_summary'] = {'total_checks': 0, 'passed': 0, 'failed': 0, 'warnings': 0}
@@ -78,15 +79,13 @@ def process_psa_file(
         result['fixture_df'] = fixture_df
         result['fixture_validation'] = fixture_validation
         result['fixture_summary'] = fixture_summary
-        print(f"[SUCCESS] Fixture: {len(fixture_df)} rows, {len(fixture_df.columns)} columns")
+        logger.info("Fixture: %s rows, %s columns", len(fixture_df), len(fixture_df.columns))
     except Exception as e:
-        print(f"[ERROR] Fixture extraction failed: {e}")
+        logger.error("Fixture extraction failed: %s", e)
         result['fixture_df'] = None
         result['fixture_validation'] = []
         result['fixture_summary'] = {'total_checks': 0, 'passed': 0, 'failed': 0, 'warnings': 0}
     
-    print("="*80)
-    print("PSA PROCESSOR: Extraction complete")
-    print("="*80)
+    logger.info("Extraction complete")
     
     return result
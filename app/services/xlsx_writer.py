@@ -80,7 +80,7 @@ def write_raw_products_xlsx_bytes(product_rows: list[list[str]]) -> bytes:
     if not product_rows:
         raise ValueError("No product rows")
 
-    max_cols = max(len(r) for r in product_rows)
+    max_cols = max(map(len, product_rows))
     
     # Use standardized headers
     headers = create_standard_headers(max_cols)
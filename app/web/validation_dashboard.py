@@ -1,8 +1,39 @@
 """Validation Dashboard HTML Template."""
 
-from typing import List, Dict, Any
+from typing import Any, AsyncIterator, Dict, Iterator, List
 from app.services.product_validator import ValidationResult
 
+# Whitespace between the table sections of the dashboard
+_SECTION_SEPARATOR = "\n            \n            "
+
+# Everything after the last table section (static - no placeholders)
+_DASHBOARD_TAIL = """
+            
+            <div class="footer">
+                <a href="/" class="back-button">← Back to Upload</a>
+            </div>
+        </div>
+        
+        <script>
+            // Toggle sections
+            document.querySelectorAll('.section-header').forEach(header => {
+                header.addEventListener('click', () => {
+                    header.parentElement.classList.toggle('expanded');
+                });
+            });
+            
+            // Auto-expand failed sections
+            document.querySelectorAll('.section').forEach(section => {
+                const hasFailed = section.querySelector('.check-item.fail');
+                if (hasFailed) {
+                    section.classList.add('expanded');
+                }
+            });
+        </script>
+    </body>
+    </html>
+    """
+
 
 def get_validation_dashboard(data: Dict[str, Any]) -> str:
     """Generate interactive HTML dashboard for validation results.
@@ -15,6 +46,28 @@ def get_validation_dashboard(data: Dict[str, Any]) -> str:
     Returns:
         HTML string for validation dashboard
     """
+    return "".join(_iter_dashboard_chunks(data))
+
+
+async def iter_validation_dashboard(data: Dict[str, Any]) -> AsyncIterator[str]:
+    """Stream the validation dashboard HTML in chunks.
+    
+    Yields the page head and summary cards first, then each table's
+    section as it is generated, so the browser can start rendering before
+    the whole page is built.
+    
+    Args:
+        data: Dict from psa_processor (see get_validation_dashboard)
+    
+    Yields:
+        HTML chunks that together form the validation dashboard
+    """
+    for chunk in _iter_dashboard_chunks(data):
+        yield chunk
+
+
+def _iter_dashboard_chunks(data: Dict[str, Any]) -> Iterator[str]:
+    """Generate the dashboard HTML as head, one chunk per table, and tail."""
     
     # Calculate combined stats
     total_checks = 0
@@ -62,28 +115,7 @@ def get_validation_dashboard(data: Dict[str, Any]) -> str:
         status_color = "#2a8703"  # Walmart green
         status_bg = "#f0fdf4"
     
-    # Generate Product checks HTML
-    product_checks_html = _generate_table_checks_html(
-        "Product",
-        data['product_validation'],
-        data['product_summary']
-    )
-    
-    # Generate Planogram checks HTML
-    planogram_checks_html = _generate_table_checks_html(
-        "Planogram",
-        data['planogram_validation'],
-        data['planogram_summary']
-    )
-    
-    # Generate Fixture checks HTML
-    fixture_checks_html = _generate_table_checks_html(
-        "Fixture",
-        data.get('fixture_validation', []),
-        data.get('fixture_summary', {'total_checks': 0, 'passed': 0, 'failed': 0, 'warnings': 0})
-    )
-    
-    return f"""
+    yield f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -493,36 +525,31 @@ def get_validation_dashboard(data: Dict[str, Any]) -> str:
                 </div>
             </div>
             
-            {product_checks_html}
-            
-            {planogram_checks_html}
-            
-            {fixture_checks_html}
-            
-            <div class="footer">
-                <a href="/" class="back-button">← Back to Upload</a>
-            </div>
-        </div>
-        
-        <script>
-            // Toggle sections
-            document.querySelectorAll('.section-header').forEach(header => {{
-                header.addEventListener('click', () => {{
-                    header.parentElement.classList.toggle('expanded');
-                }});
-            }});
-            
-            // Auto-expand failed sections
-            document.querySelectorAll('.section').forEach(section => {{
-                const hasFailed = section.querySelector('.check-item.fail');
-                if (hasFailed) {{
-                    section.classList.add('expanded');
-                }}
-            }});
-        </script>
-    </body>
-    </html>
-    """
+            """
+    
+    # Generate Product checks HTML
+    yield _generate_table_checks_html(
+        "Product",
+        data['product_validation'],
+        data['product_summary']
+    )
+    
+    # Generate Planogram checks HTML
+    yield _SECTION_SEPARATOR + _generate_table_checks_html(
+        "Planogram",
+        data['planogram_validation'],
+        data['planogram_summary']
+    )
+    
+    # Generate Fixture checks HTML
+    yield _SECTION_SEPARATOR + _generate_table_checks_html(
+        "Fixture",
+        data.get('fixture_validation', []),
+        data.get('fixture_summary', {'total_checks': 0, 'passed': 0, 'failed': 0, 'warnings': 0})
+    )
+    
+    yield _DASHBOARD_TAIL
+
 
 
 def _generate_all_checks_list(validation_results: List[ValidationResult]) -> str: